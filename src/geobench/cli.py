@@ -105,6 +105,11 @@ class CLI:
             type=int,
             help="Number of repeats (default: 1)",
         )
+        self.parser.add_argument(
+            "--warmup",
+            type=int,
+            help="Number of warmup runs (default: 0)",
+        )
         self.parser.add_argument(
             "-i",
             "--input",
@@ -185,6 +190,12 @@ class CLI:
             choices=["none", "both", "input", "output"],
             help="File types to archive (default: both)",
         )
+        self.parser.add_argument(
+            "--link-inputs",
+            action="store_true",
+            default=None,
+            help="Hard link archived input files instead of copying them",
+        )
         self.parser.add_argument(
             "--workdir",
             type=str,
@@ -214,8 +225,17 @@ class CLI:
         self.parser.add_argument(
             "--clean-outputs",
             action="store_true",
+            default=None,
             help="Clean the output files",
         )
+        self.parser.add_argument(
+            "-p",
+            "--parallel",
+            type=int,
+            default=1,
+            help="Number of runs to execute in parallel, for scenarios without outputs. "
+            "Parallel runs skip per-run idle waits and monitoring",
+        )
         self.parser.add_argument(
             "-d",
             "--debug",
@@ -259,7 +279,16 @@ class CLI:
             for key, val in vars(args).items()
             if val is not None
             and key
-            not in ["command", "arg", "args", "input", "output", "clean", "debug"]
+            not in [
+                "command",
+                "arg",
+                "args",
+                "input",
+                "output",
+                "clean",
+                "parallel",
+                "debug",
+            ]
         }
 
         kwargs["arguments"] = merge_args(
@@ -292,7 +321,7 @@ class CLI:
             kwargs["command"] = args.command
             scenario = Scenario(**kwargs)
 
-        scenario.benchmark(clean=args.clean)
+        scenario.benchmark(clean=args.clean, parallel=args.parallel)
 
 
 def main():
@@ -1,7 +1,7 @@
 from typing import Any, Callable
 import json
 import os
-import statistics
+import sys
 import threading
 import time
 import traceback
@@ -10,13 +10,28 @@ import psutil
 
 from .cache import clear_cache
 from .monitor import get_system_info, monitor_process, monitor_system
-from .report import calculate_run_summary, generate_html_report
 
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+def _setup_logger():
+    """Show benchmark status messages in the notebook.
+
+    Notebooks do not configure logging, so the messages would be dropped by the
+    root logger. If logging is not configured, a handler writing to the standard
+    output is attached to the module logger.
+    """
+    if logger.hasHandlers():
+        return
+
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+
+
 class Geobench:
     """Class for benchmarking code execution in Jupyter notebooks."""
 
@@ -39,6 +54,8 @@ class Geobench:
             system_monitor (float): Monitoring time before and after all runs (s) (default = 2.0)
             clean (bool): Set True to clean the output directory, if exists.
         """
+        _setup_logger()
+
         self.name = name
         self.run_wait = run_wait
         self.run_monitor = run_monitor
@@ -113,7 +130,7 @@ class Geobench:
         if run_name is None:
             run_name = f"run_{len(self.result['runs']) + 1}"
 
-        print(f"Starting benchmark: {run_name}")
+        logger.info("Starting benchmark: %s", run_name)
 
         # Create run directory
         run_dir = os.path.join(self.outdir, run_name.replace(" ", "_").lower())
@@ -121,12 +138,12 @@ class Geobench:
 
         # Store system information only at first run
         if self.result["system"] is None:
-            print("Storing system information.")
+            logger.info("Storing system information.")
             self.result["system"] = get_system_info()
             self._save_result()
 
         # Perform system cleanup
-        print("Clearing system caches.")
+        logger.info("Clearing system caches.")
         clear_cache()
 
         # Record first run start
@@ -135,7 +152,7 @@ class Geobench:
 
         # Idle wait before the run, if required
         if self.run_wait:
-            print(f"Waiting {self.run_wait} s before the run.")
+            logger.info("Waiting %s s before the run.", self.run_wait)
             time.sleep(self.run_wait)
 
         # Create run data structure
@@ -152,7 +169,7 @@ class Geobench:
 
         # Perform baseline monitoring before the run, if required
         if self.run_monitor:
-            print(f"Baseline monitoring for {self.run_monitor} s.")
+            logger.info("Baseline monitoring for %s s.", self.run_monitor)
             self._current_run["baseline"] = monitor_system(self.run_monitor)
 
         # Set up and start the process monitoring in a background thread
@@ -162,7 +179,7 @@ class Geobench:
         )
         self._monitoring_thread.start()
 
-        print("Process monitoring started.")
+        logger.info("Process monitoring started.")
 
         # Store partial run data
         run_path = os.path.join(run_dir, "result.json")
@@ -186,7 +203,7 @@ class Geobench:
 
         self._stop_event.set()  # Signal to stop
         self._monitoring_thread.join(timeout=2.0)
-        print("Process monitoring stopped.")
+        logger.info("Process monitoring stopped.")
 
         # Set success status and end time if not already set
         self._current_run["end_time"] = time.time()
@@ -195,12 +212,12 @@ class Geobench:
 
         # Idle wait after the run, if required
         if self.run_wait:
-            print(f"Waiting {self.run_wait} s after the run.")
+            logger.info("Waiting %s s after the run.", self.run_wait)
             time.sleep(self.run_wait)
 
         # Perform endline monitoring after the run, if required
         if self.run_monitor:
-            print(f"Endline monitoring for {self.run_monitor} s.")
+            logger.info("Endline monitoring for %s s.", self.run_monitor)
             self._current_run["endline"] = monitor_system(self.run_monitor)
 
         # Store run data in run directory
@@ -209,6 +226,8 @@ class Geobench:
             json.dump(self._current_run, f, ensure_ascii=False, indent=2)
 
         # Calculate run summary and append to results
+        from .report import calculate_run_summary
+
         run_summary = calculate_run_summary(self._current_run)
         summary_path = os.path.join(self._current_run["directory"], "summary.json")
         with open(summary_path, "w", encoding="utf-8") as f:
@@ -234,8 +253,9 @@ class Geobench:
         run_result = self._current_run
         self._current_run = None
 
-        print(
-            f"Benchmark completed in {run_result['end_time'] - run_result['start_time']:.2f} s."
+        logger.info(
+            "Benchmark completed in %.2f s.",
+            run_result["end_time"] - run_result["start_time"],
         )
 
         return run_summary
@@ -256,7 +276,7 @@ class Geobench:
 
         # Run the function (monitoring is already happening from start())
         try:
-            print("Executing the function with process monitoring.")
+            logger.info("Executing the function with process monitoring.")
 
             # Execute the function
             start_time = time.time()
@@ -288,6 +308,12 @@ class Geobench:
         Returns:
             str: Path to the generated report.
         """
+        from .report import (
+            calculate_run_summary,
+            calculate_set_summary,
+            generate_html_report,
+        )
+
         # Prepare set summary data structure expected by generate_html_report
         set_summaries = []
 
@@ -297,36 +323,9 @@ class Geobench:
             run_summaries = [calculate_run_summary(run)]
 
             # Calculate statistics for the set
-            total_runs = len(run_summaries)
-            success_rate = (
-                (
-                    sum(1 for run_summary in run_summaries if run_summary["success"])
-                    / total_runs
-                )
-                if total_runs > 0
-                else 0
+            set_summary = calculate_set_summary(
+                set_id, run.get("arguments", {}), run_summaries
             )
-
-            # Calculate average and standard deviation of execution time for all runs in a set
-            run_time_list = [
-                run_summary["run_time"]
-                for run_summary in run_summaries
-                if "run_time" in run_summary
-            ]
-            avg_run_time = statistics.mean(run_time_list) if run_time_list else 0
-            stdev_run_time = (
-                statistics.stdev(run_time_list) if len(run_time_list) > 1 else 0
-            )
-
-            set_summary = {
-                "set": set_id,
-                "arguments": run.get("arguments", {}),
-                "total": total_runs,
-                "success": success_rate,
-                "avg_run_time": avg_run_time,
-                "stdev_run_time": stdev_run_time,
-                "runs": run_summaries,
-            }
             set_summaries.append(set_summary)
 
         # Generate HTML report
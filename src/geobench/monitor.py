@@ -1,7 +1,10 @@
 """Monitoring module."""
 
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
+import math
+from operator import itemgetter
 import platform
-import statistics
 import threading
 import time
 
@@ -14,12 +17,10 @@ import logging
 logger = logging.getLogger(__name__)
 
 
-def get_system_info() -> dict:
-    """Returns system information."""
-    out = {}
-
-    # OS information
-    out["os"] = {
+@cache
+def _get_os_info() -> dict:
+    """Returns operating system information, which does not change while running."""
+    return {
         "system": platform.system(),
         "node": platform.node(),
         "release": platform.release(),
@@ -28,13 +29,38 @@ def get_system_info() -> dict:
         "processor": platform.processor(),
     }
 
+
+def _get_disk_info(partition) -> dict:
+    """Returns disk partition information including its usage, if permitted."""
+    info = {
+        "device": partition.device,
+        "mountpoint": partition.mountpoint,
+        "fstype": partition.fstype,
+    }
+    try:
+        info.update(psutil.disk_usage(partition.mountpoint)._asdict())
+
+    except PermissionError:
+        pass
+
+    return info
+
+
+def get_system_info() -> dict:
+    """Returns system information."""
+    out = {}
+
+    # OS information
+    out["os"] = dict(_get_os_info())
+
     # CPU information
+    freq = psutil.cpu_freq()
     out["cpu"] = {
         "physical_count": psutil.cpu_count(logical=False),
         "logical_count": psutil.cpu_count(logical=True),
-        "max_frequency": psutil.cpu_freq().max,
-        "min_frequency": psutil.cpu_freq().min,
-        "frequency": psutil.cpu_freq().current,
+        "max_frequency": freq.max if freq else None,
+        "min_frequency": freq.min if freq else None,
+        "frequency": freq.current if freq else None,
         "percent": psutil.cpu_percent(interval=0.1, percpu=True),
     }
 
@@ -42,51 +68,56 @@ def get_system_info() -> dict:
     out["memory"] = psutil.virtual_memory()._asdict()
 
     # Disk information
+    # REMARK: Usage of the partitions is queried in parallel, as querying a slow
+    # (e.g. network) mount can block.
+    partitions = psutil.disk_partitions()
     out["disk"] = []
-    for partition in psutil.disk_partitions():
-        info = {
-            "device": partition.device,
-            "mountpoint": partition.mountpoint,
-            "fstype": partition.fstype,
-        }
-        try:
-            info.update(psutil.disk_usage(partition.mountpoint)._asdict())
-
-        except PermissionError:
-            pass
-
-        out["disk"].append(info)
+    if partitions:
+        with ThreadPoolExecutor(max_workers=len(partitions)) as executor:
+            out["disk"] = list(executor.map(_get_disk_info, partitions))
 
     return out
 
 
-def get_process_info(process) -> dict:
+def get_process_info(process, include_environment: bool = False) -> dict:
     """Returns process information.
 
     Args:
         process: Process.
+        include_environment: Include environment variables of the process (default = False).
 
     Returns:
         Dictionary of process information.
     """
-    return {
-        "pid": process.pid,
-        "parent_pid": process.ppid(),
-        "name": process.name(),
-        "executable": process.exe(),
-        "command": process.cmdline(),
-        "environment": process.environ(),
-        "create_time": process.create_time(),
-        "metrics": [],
-    }
+    with process.oneshot():
+        out = {
+            "pid": process.pid,
+            "parent_pid": process.ppid(),
+            "name": process.name(),
+            "executable": process.exe(),
+            "command": process.cmdline(),
+            "create_time": process.create_time(),
+            "metrics": [],
+        }
+
+        if include_environment:
+            out["environment"] = process.environ()
+
+    return out
 
 
-def monitor_system(duration: float = 10.0, interval: float = 1.0) -> dict:
+def monitor_system(
+    duration: float | None = 10.0,
+    interval: float = 1.0,
+    stop_event: threading.Event | None = None,
+) -> dict:
     """Performs system monitoring for a specific duration.
 
     Args:
-        duration: Monitoring duration in seconds (default = 10.0).
+        duration: Monitoring duration in seconds (default = 10.0). If None, monitoring
+            continues until the stop event is set.
         interval: Interval between each sample in seconds (default = 1.0)
+        stop_event: Optional event to signal monitoring to stop.
 
     Returns:
         Dictionary of system monitoring results.
@@ -96,42 +127,82 @@ def monitor_system(duration: float = 10.0, interval: float = 1.0) -> dict:
     memory_percents = []
     processes = []
     summary = {}
+    stats = {}
+    cpu_percent_sum = 0.0
+    memory_percent_sum = 0.0
+    # Processes without accessible I/O counters, which are not queried again
+    no_io_pids = set()
+
+    # Initialize CPU usage counters, so that each sample covers an interval
+    psutil.cpu_percent()
+    for proc in psutil.process_iter():
+        try:
+            proc.cpu_percent()
 
-    start_time = time.time()
+        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+            pass
+
+    # Sample at fixed deadlines, so that sampling time does not delay the next sample
+    next_time = start_time = time.monotonic()
+    end_time = next_time + duration if duration is not None else math.inf
     while True:
-        now = time.time()
-        if (now - start_time) >= duration:
+        current_time = time.monotonic()
+        if current_time >= end_time:
+            break
+
+        # Skip deadlines missed while sampling, instead of sampling back-to-back
+        next_time += interval
+        if next_time < current_time and interval > 0:
+            next_time += math.ceil((current_time - next_time) / interval) * interval
+
+        # Sleep until the next sample, never past the end of the duration, or stop
+        # if the stop event is set
+        next_time = min(next_time, end_time)
+        delay = max(0.0, next_time - current_time)
+        if stop_event is None:
+            time.sleep(delay)
+        elif stop_event.wait(delay):
             break
 
+        now = time.time()
         timestamps.append(now)
-        cpu_percents.append(psutil.cpu_percent())
-        memory_percents.append(psutil.virtual_memory().percent)
+
+        cpu_percent = psutil.cpu_percent()
+        cpu_percents.append(cpu_percent)
+        cpu_percent_sum += cpu_percent
+
+        memory_percent = psutil.virtual_memory().percent
+        memory_percents.append(memory_percent)
+        memory_percent_sum += memory_percent
 
         data = []
-        for proc in psutil.process_iter(
-            ["pid", "name", "username", "cpu_percent", "memory_percent", "status"]
-        ):
+        for proc in psutil.process_iter():
             try:
-                info = proc.info
-
-                try:
-                    io_counters = proc.io_counters()
-                    read_bytes = io_counters.read_bytes
-                    write_bytes = io_counters.write_bytes
+                # Read process attributes and I/O counters in a single pass
+                with proc.oneshot():
+                    info = proc.as_dict(
+                        [
+                            "pid",
+                            "name",
+                            "username",
+                            "cpu_percent",
+                            "memory_percent",
+                            "status",
+                        ]
+                    )
 
-                except (psutil.AccessDenied, AttributeError):
                     read_bytes = None
                     write_bytes = None
+                    if proc.pid not in no_io_pids:
+                        try:
+                            io_counters = proc.io_counters()
+                            read_bytes = io_counters.read_bytes
+                            write_bytes = io_counters.write_bytes
 
-                pid = info["pid"]
+                        except (psutil.AccessDenied, AttributeError):
+                            no_io_pids.add(proc.pid)
 
-                if pid not in summary:
-                    summary[pid] = {
-                        "pid": pid,
-                        "name": info["name"],
-                        "username": info.get("username"),
-                        "data": [],
-                    }
+                pid = info["pid"]
 
                 item = {
                     "pid": pid,
@@ -146,50 +217,62 @@ def monitor_system(duration: float = 10.0, interval: float = 1.0) -> dict:
                 }
 
                 data.append(item)
-                summary[pid]["data"].append(item)
+
+                # Update running statistics of the process
+                if pid not in summary:
+                    summary[pid] = {
+                        "pid": pid,
+                        "name": info["name"],
+                        "username": info.get("username"),
+                    }
+                    stats[pid] = {
+                        "count": 0,
+                        "cpu_percent": 0.0,
+                        "memory_percent": 0.0,
+                        "first_read_bytes": item["read_bytes"],
+                        "first_write_bytes": item["write_bytes"],
+                    }
+
+                pid_stats = stats[pid]
+                pid_stats["count"] += 1
+                pid_stats["cpu_percent"] += item["cpu_percent"]
+                pid_stats["memory_percent"] += item["memory_percent"]
+                pid_stats["last_read_bytes"] = item["read_bytes"]
+                pid_stats["last_write_bytes"] = item["write_bytes"]
 
             except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
                 pass
 
         processes.append(data)
 
-        time.sleep(interval)
-
-    for item in summary.values():
-        data = item["data"]
-        # Only include non-None values for calculating average CPU and memory
-        cpu_percent_list = [
-            item["cpu_percent"] for item in data if item["cpu_percent"] is not None
-        ]
-        if cpu_percent_list:
-            item["avg_cpu_percent"] = statistics.mean(cpu_percent_list)
-        memory_percent_list = [
-            item["memory_percent"]
-            for item in data
-            if item["memory_percent"] is not None
-        ]
-        if memory_percent_list:
-            item["avg_memory_percent"] = statistics.mean(memory_percent_list)
-        # Check if read/write bytes are available at the first and last data points
-        if len(data) > 0:
-            # Calculate read/write bytes if the values are not None
-            if data[-1]["read_bytes"] and data[0]["read_bytes"]:
-                item["read_bytes"] = data[-1]["read_bytes"] - data[0]["read_bytes"]
-            # Calculate read/write bytes if the values are not None
-            if data[-1]["write_bytes"] and data[0]["write_bytes"]:
-                item["write_bytes"] = data[-1]["write_bytes"] - data[0]["write_bytes"]
-        del item["data"]
+    for pid, item in summary.items():
+        pid_stats = stats[pid]
+        item["avg_cpu_percent"] = pid_stats["cpu_percent"] / pid_stats["count"]
+        item["avg_memory_percent"] = pid_stats["memory_percent"] / pid_stats["count"]
+        # Calculate read/write bytes if the values are available at the first and last samples
+        if pid_stats["last_read_bytes"] and pid_stats["first_read_bytes"]:
+            item["read_bytes"] = (
+                pid_stats["last_read_bytes"] - pid_stats["first_read_bytes"]
+            )
+        if pid_stats["last_write_bytes"] and pid_stats["first_write_bytes"]:
+            item["write_bytes"] = (
+                pid_stats["last_write_bytes"] - pid_stats["first_write_bytes"]
+            )
+
+    elapsed_time = time.monotonic() - start_time
 
     summary = list(summary.values())
-    summary.sort(key=lambda item: item["avg_cpu_percent"], reverse=True)
+    summary.sort(key=itemgetter("avg_cpu_percent"), reverse=True)
 
     return {
-        "duration": duration,
+        "duration": duration if duration is not None else elapsed_time,
         "interval": interval,
-        "start_time": timestamps[0],
-        "end_time": timestamps[-1],
-        "avg_cpu_percent": statistics.mean(cpu_percents) if cpu_percents else None,
-        "avg_memory_percent": statistics.mean(memory_percents)
+        "start_time": timestamps[0] if timestamps else None,
+        "end_time": timestamps[-1] if timestamps else None,
+        "avg_cpu_percent": cpu_percent_sum / len(cpu_percents)
+        if cpu_percents
+        else None,
+        "avg_memory_percent": memory_percent_sum / len(memory_percents)
         if memory_percents
         else None,
         "process_summary": summary,
@@ -273,10 +356,88 @@ class DataCollector(threading.Thread):
         """
         for collector in self.collectors:
             collector.postprocess(self.data)
-       
+
         return self.data
 
 
+def _has_stopped(process, stop_event=None) -> bool:
+    """Returns whether the monitored process has terminated or monitoring is stopped.
+
+    Args:
+        process: Monitored process.
+        stop_event: Optional event to signal monitoring to stop.
+
+    Returns:
+        True if monitoring should stop.
+    """
+    if type(process) is psutil.Process:
+        return not process.is_running() or bool(stop_event and stop_event.is_set())
+
+    return process.poll() is not None
+
+
+def _get_processes(process, process_metrics: dict) -> list:
+    """Returns the monitored process and its running child processes.
+
+    Information of newly started child processes is added to the process metrics.
+
+    Args:
+        process: Monitored process.
+        process_metrics: Dictionary of process information by process id.
+
+    Returns:
+        List of processes.
+    """
+    processes = [process]
+    for child in process.children(recursive=True):
+        try:
+            if child.pid not in process_metrics:
+                process_metrics[child.pid] = get_process_info(child)
+
+            processes.append(child)
+            child.cpu_percent()
+
+        except psutil.NoSuchProcess:
+            logger.debug("Process %d terminated", child.pid)
+
+    return processes
+
+
+def _collect_process_metrics(processes: list, process_metrics: dict, step: int):
+    """Collects a metrics sample of each process.
+
+    Args:
+        processes: List of processes.
+        process_metrics: Dictionary of process information by process id.
+        step: Sample step.
+    """
+    for p in processes:
+        try:
+            with p.oneshot():
+                try:
+                    io_counters = p.io_counters()
+                    read_bytes = io_counters.read_bytes
+                    write_bytes = io_counters.write_bytes
+                except (psutil.AccessDenied, AttributeError):
+                    read_bytes = 0
+                    write_bytes = 0
+
+                collected_metric = {
+                    "step": step,
+                    "timestamp": time.time(),
+                    "cpu_percent": p.cpu_percent(),
+                    "memory_percent": p.memory_percent(),
+                    "num_threads": p.num_threads(),
+                    "read_bytes": read_bytes,
+                    "write_bytes": write_bytes,
+                }
+
+                process_metrics[p.pid]["metrics"].append(collected_metric)
+
+        except psutil.NoSuchProcess:
+            logger.debug("Process %d terminated", p.pid)
+
+
 def monitor_process(
     process,
     interval: float = 1.0,
@@ -363,53 +524,17 @@ def monitor_process(
             step += 1
 
             # Stop if process has terminated or stop event is set
-            if type(process) is psutil.Process:
-                if not process.is_running():
-                    break
-                if stop_event.is_set():
-                    break
-            else:
-                if process.poll() is not None:
-                    break
+            if _has_stopped(process, stop_event):
+                break
 
             # Get related processes
-            processes = [process]
-            for child in process.children(recursive=True):
-                try:
-                    if child.pid not in process_metrics:
-                        process_metrics[child.pid] = get_process_info(child)
-                    processes.append(child)
-                    child.cpu_percent()
-                except psutil.NoSuchProcess:
-                    pass
+            processes = _get_processes(process, process_metrics)
 
             # Sleep with the base interval
             time.sleep(interval)
 
             # Collect process metrics
-            for p in processes:
-                try:
-                    with p.oneshot():
-                        try:
-                            io_counters = p.io_counters()
-                            read_bytes = io_counters.read_bytes
-                            write_bytes = io_counters.write_bytes
-                        except (psutil.AccessDenied, AttributeError):
-                            read_bytes = 0
-                            write_bytes = 0
-
-                        collected_metric = {
-                            "step": step,
-                            "timestamp": time.time(),
-                            "cpu_percent": p.cpu_percent(),
-                            "memory_percent": p.memory_percent(),
-                            "num_threads": p.num_threads(),
-                            "read_bytes": read_bytes,
-                            "write_bytes": write_bytes,
-                        }
-                        process_metrics[p.pid]["metrics"].append(collected_metric)
-                except psutil.NoSuchProcess:
-                    pass
+            _collect_process_metrics(processes, process_metrics, step)
 
         # Signal all collectors to stop
         stop_event.set()
@@ -441,27 +566,11 @@ def monitor_process(
             step += 1
 
             # Stop if process has terminated or stop event is set
-            if type(process) is psutil.Process:
-                if not process.is_running():
-                    break
-                if stop_event and stop_event.is_set():
-                    break
-            else:
-                if process.poll() is not None:
-                    break
+            if _has_stopped(process, stop_event):
+                break
 
             # Get related processes
-            processes = [process]
-            for child in process.children(recursive=True):
-                try:
-                    if child.pid not in process_metrics:
-                        process_metrics[child.pid] = get_process_info(child)
-
-                    processes.append(child)
-                    child.cpu_percent()
-
-                except psutil.NoSuchProcess:
-                    pass
+            processes = _get_processes(process, process_metrics)
 
             # Sleep
             time.sleep(interval)
@@ -502,30 +611,7 @@ def monitor_process(
             system_metrics.append(sys_metric)
 
             # Get process metrics
-            for p in processes:
-                try:
-                    with p.oneshot():
-                        try:
-                            io_counters = p.io_counters()
-                            read_bytes = io_counters.read_bytes
-                            write_bytes = io_counters.write_bytes
-                        except (psutil.AccessDenied, AttributeError):
-                            read_bytes = 0
-                            write_bytes = 0
-                        collected_metric = {
-                            "step": step,
-                            "timestamp": time.time(),
-                            "cpu_percent": p.cpu_percent(),
-                            "memory_percent": p.memory_percent(),
-                            "num_threads": p.num_threads(),
-                            "read_bytes": read_bytes,
-                            "write_bytes": write_bytes,
-                        }
-
-                        process_metrics[p.pid]["metrics"].append(collected_metric)
-
-                except psutil.NoSuchProcess:
-                    pass
+            _collect_process_metrics(processes, process_metrics, step)
 
         out = {"system": system_metrics, "processes": process_metrics}
 
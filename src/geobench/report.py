@@ -1,18 +1,219 @@
 """Report module."""
 
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import cache
+from itertools import cycle
 from typing import Dict, List
+import base64
 import json
 import os
-import statistics
 
-from jinja2 import Environment, FileSystemLoader
-import plotly.graph_objects as go
+from jinja2 import Environment, FileSystemLoader, Template
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def load_result(path: str) -> dict:
+    """Load a result file.
+
+    orjson is used if available, as it parses large monitoring results
+    considerably faster than the standard library.
+
+    Args:
+        path: Path of the result file.
+
+    Returns:
+        Result data.
+    """
+    if orjson is not None:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _scan_results(path: str):
+    """Scan run result files of sets in an output directory.
+
+    Set and run directories are listed once, using the cached entry types.
+
+    Args:
+        path: Path of the output directory.
+
+    Yields:
+        Tuple of set directory name and list of run result file paths, sorted by
+        run directory name.
+    """
+    with os.scandir(path) as set_entries:
+        for set_entry in set_entries:
+            if not set_entry.is_dir():
+                continue
+
+            with os.scandir(set_entry.path) as run_entries:
+                run_entries = sorted(
+                    (entry for entry in run_entries if entry.is_dir()),
+                    key=lambda entry: entry.name,
+                )
+            yield (
+                set_entry.name,
+                [os.path.join(entry.path, "result.json") for entry in run_entries],
+            )
+
+
+def _divide(totals: np.ndarray, counts: np.ndarray) -> np.ndarray:
+    """Divide totals by counts, which is 0.0 where the count is zero.
+
+    Args:
+        totals: Array of totals.
+        counts: Array of counts.
+
+    Returns:
+        Array of quotients.
+    """
+    return np.divide(totals, counts, out=np.zeros(np.shape(totals)), where=counts > 0)
+
+
+def _accumulate(totals: np.ndarray, counts: np.ndarray, values: np.ndarray):
+    """Add valid values and their counts to the leading running totals and counts.
+
+    Args:
+        totals: Array of running totals, updated in place.
+        counts: Array of running counts, updated in place.
+        values: Array of values, where NaNs are ignored.
+    """
+    valid = ~np.isnan(values)
+    totals[: len(values)] += np.where(valid, values, 0.0)
+    counts[: len(values)] += valid
+
+
+def _nanmean(values: np.ndarray) -> float:
+    """Calculate mean of values ignoring NaNs, which is 0.0 if there is no value.
+
+    Args:
+        values: Array of values.
+
+    Returns:
+        Mean value.
+    """
+    valid = ~np.isnan(values)
+    return float(_divide(np.where(valid, values, 0.0).sum(), valid.sum()))
+
+
+def _nanstdev(values: np.ndarray) -> float:
+    """Calculate sample standard deviation of values ignoring NaNs.
+
+    Args:
+        values: Array of values.
+
+    Returns:
+        Standard deviation, or 0.0 if there are less than two values.
+    """
+    values = values[~np.isnan(values)]
+    return float(np.std(values, ddof=1)) if len(values) > 1 else 0.0
+
+
+def _calculate_process_statistics(process_metrics: list) -> dict:
+    """Calculate statistics of a process from its metrics.
+
+    The metrics are extracted into a single array in one pass, which is then
+    reduced column-wise. Step, CPU and memory timelines are kept for charts,
+    with missing values dropped from each timeline separately.
+
+    Args:
+        process_metrics: List of process metrics.
+
+    Returns:
+        Process statistics.
+    """
+    metrics = np.array(
+        [
+            [
+                m.get("step"),
+                m.get("cpu_percent"),
+                m.get("memory_percent"),
+                m.get("num_threads"),
+                m.get("read_bytes"),
+                m.get("write_bytes"),
+            ]
+            for m in process_metrics
+        ],
+        dtype=float,
+    ).reshape(-1, 6)
+    (
+        step_timeline,
+        cpu_timeline,
+        memory_timeline,
+        thread_timeline,
+        read_bytes,
+        write_bytes,
+    ) = metrics.T
+    thread_timeline = thread_timeline[~np.isnan(thread_timeline)]
+    read_bytes = read_bytes[~np.isnan(read_bytes)]
+    write_bytes = write_bytes[~np.isnan(write_bytes)]
+
+    # Calculate process running time
+    running_time = 0
+    if len(process_metrics) >= 2:
+        # Get start and end timestamps
+        running_time = (
+            process_metrics[-1]["timestamp"] - process_metrics[0]["timestamp"]
+        )
+
+    return {
+        "running_time": running_time,
+        "avg_cpu_percent": _nanmean(cpu_timeline),
+        "stdev_cpu_percent": _nanstdev(cpu_timeline),
+        "avg_memory_percent": _nanmean(memory_timeline),
+        "stdev_memory_percent": _nanstdev(memory_timeline),
+        "avg_read_bytes": int(read_bytes[-1] - read_bytes[0])
+        if len(read_bytes) > 1
+        else 0.0,
+        "avg_write_bytes": int(write_bytes[-1] - write_bytes[0])
+        if len(write_bytes) > 1
+        else 0.0,
+        "max_num_threads": int(thread_timeline.max()) if len(thread_timeline) else 0,
+        "timelines": {
+            "step": step_timeline[~np.isnan(step_timeline)].tolist(),
+            "cpu_percent": cpu_timeline[~np.isnan(cpu_timeline)].tolist(),
+            "memory_percent": memory_timeline[~np.isnan(memory_timeline)].tolist(),
+        },
+    }
+
+
+# Keys of system monitoring results holding the individual samples
+_MONITORING_SAMPLE_KEYS = frozenset(
+    ("timestamps", "cpu_percents", "memory_percents", "processes")
+)
+
+
+def _summarize_monitoring(monitoring: dict | None) -> dict:
+    """Return system monitoring results without the individual samples.
+
+    Args:
+        monitoring: System monitoring results.
+
+    Returns:
+        System monitoring summary.
+    """
+    return {
+        key: val
+        for key, val in (monitoring or {}).items()
+        if key not in _MONITORING_SAMPLE_KEYS
+    }
 
 
 def calculate_run_summary(run_result: dict) -> dict:
     """Calculate summary statistics from a run result.
 
+    Individual monitoring samples are not included in the summary, which keeps
+    set summaries small when there are many or long runs.
+
     Args:
         run_result: The run result data.
 
@@ -32,8 +233,8 @@ def calculate_run_summary(run_result: dict) -> dict:
         "avg_system_memory_overall": 0,
         "num_processes": 0,
         "processes": {},
-        "baseline": run_result.get("baseline", {}),
-        "endline": run_result.get("endline", {}),
+        "baseline": _summarize_monitoring(run_result.get("baseline")),
+        "endline": _summarize_monitoring(run_result.get("endline")),
     }
 
     internal_system_data = []
@@ -44,38 +245,49 @@ def calculate_run_summary(run_result: dict) -> dict:
     elif isinstance(collected_system_data, dict):
         internal_system_data = collected_system_data.get("internal", [])
 
-    # Calculate Average per-core system CPU usage
-    system_per_cpu_list = []
+    # Calculate average per-core system CPU and per-type system memory usage
     if internal_system_data:
+        num_cpus = max(
+            len(system_data["cpu_percent"]) for system_data in internal_system_data
+        )
+        # Collect memory types across all samples, in first-seen order
+        memory_types = list(
+            dict.fromkeys(
+                type
+                for system_data in internal_system_data
+                for type in system_data["memory_usage"]
+            )
+        )
+
+        # Accumulate sums and counts of valid values in a single pass
+        cpu_sums = np.zeros(num_cpus)
+        cpu_counts = np.zeros(num_cpus)
+        memory_sums = np.zeros(len(memory_types))
+        memory_counts = np.zeros(len(memory_types))
         for system_data in internal_system_data:
-            for i, cpu_percent in enumerate(system_data["cpu_percent"]):
-                if i >= len(system_per_cpu_list):
-                    system_per_cpu_list.append([])
-                if cpu_percent is not None:
-                    system_per_cpu_list[i].append(cpu_percent)
-        for cpu_usage in system_per_cpu_list:
-            avg_cpu = statistics.mean(cpu_usage) if cpu_usage else 0.0
-            summary["avg_system_cpu"].append(avg_cpu)
+            cpu_percent = np.array(system_data["cpu_percent"], dtype=float)
+            _accumulate(cpu_sums, cpu_counts, cpu_percent)
+            memory_usage = system_data["memory_usage"]
+            _accumulate(
+                memory_sums,
+                memory_counts,
+                np.array(
+                    [memory_usage.get(type) for type in memory_types], dtype=float
+                ),
+            )
+
+        summary["avg_system_cpu"] = _divide(cpu_sums, cpu_counts).tolist()
 
         # Then, calculate the overall average
         summary["avg_system_cpu_overall"] = (
-            statistics.mean(summary["avg_system_cpu"])
+            float(np.mean(summary["avg_system_cpu"]))
             if summary["avg_system_cpu"]
             else 0.0
         )
 
-    # Calculate average per-type system memory usage
-    system_memory_dict = {}
-    if internal_system_data:
-        for system_data in internal_system_data:
-            for type, mem_usage in system_data["memory_usage"].items():
-                if type not in system_memory_dict:
-                    system_memory_dict[type] = []
-                if mem_usage is not None:
-                    system_memory_dict[type].append(mem_usage)
-        for type, mem_usage in system_memory_dict.items():
-            avg_mem = statistics.mean(mem_usage) if mem_usage else 0.0
-            summary["avg_system_memory"][type] = avg_mem
+        summary["avg_system_memory"] = dict(
+            zip(memory_types, _divide(memory_sums, memory_counts).tolist())
+        )
 
         # Then, calculate the overall memory usage
         total_memory_usage = summary["avg_system_memory"].get("total", 0.0)
@@ -87,32 +299,19 @@ def calculate_run_summary(run_result: dict) -> dict:
         )
         summary["avg_system_memory_overall"] = overall_memory_usage
 
-    # Calculate average system disk and net
-    system_disk_bytes_read_list = []
-    system_disk_bytes_write_list = []
-    system_net_bytes_sent_list = []
-    system_net_bytes_recv_list = []
-    for system_data in internal_system_data:
-        system_disk_bytes_read_list.append(system_data.get("disk_bytes_read", 0))
-        system_disk_bytes_write_list.append(system_data.get("disk_bytes_write", 0))
-        system_net_bytes_sent_list.append(system_data.get("net_bytes_sent", 0))
-        system_net_bytes_recv_list.append(system_data.get("net_bytes_recv", 0))
-    summary["avg_disk_bytes"] = {
-        "read": system_disk_bytes_read_list[-1] - system_disk_bytes_read_list[0]
-        if len(system_disk_bytes_read_list) > 1
-        else 0.0,
-        "write": system_disk_bytes_write_list[-1] - system_disk_bytes_write_list[0]
-        if len(system_disk_bytes_write_list) > 1
-        else 0.0,
-    }
-    summary["avg_net_bytes"] = {
-        "sent": system_net_bytes_sent_list[-1] - system_net_bytes_sent_list[0]
-        if len(system_net_bytes_sent_list) > 1
-        else 0.0,
-        "recv": system_net_bytes_recv_list[-1] - system_net_bytes_recv_list[0]
-        if len(system_net_bytes_recv_list) > 1
-        else 0.0,
-    }
+    # Calculate average system disk and net from the first and last samples
+    summary["avg_disk_bytes"] = {"read": 0.0, "write": 0.0}
+    summary["avg_net_bytes"] = {"sent": 0.0, "recv": 0.0}
+    if len(internal_system_data) > 1:
+        first, last = internal_system_data[0], internal_system_data[-1]
+        summary["avg_disk_bytes"] = {
+            "read": last.get("disk_bytes_read", 0) - first.get("disk_bytes_read", 0),
+            "write": last.get("disk_bytes_write", 0) - first.get("disk_bytes_write", 0),
+        }
+        summary["avg_net_bytes"] = {
+            "sent": last.get("net_bytes_sent", 0) - first.get("net_bytes_sent", 0),
+            "recv": last.get("net_bytes_recv", 0) - first.get("net_bytes_recv", 0),
+        }
 
     # Calculate running time of a single run
     if "start_time" in run_result and "end_time" in run_result:
@@ -129,68 +328,13 @@ def calculate_run_summary(run_result: dict) -> dict:
             if "metrics" in process_info:
                 process_metrics = process_info["metrics"]
 
-                cpu_timeline = []
-                memory_timeline = []
-                io_write_bytes_timeline = []
-                io_read_bytes_timeline = []
-                thread_timeline = []
-                step_timeline = []
-
-                # Store timeline data into lists
-                for m in process_metrics:
-                    if (step := m.get("step", None)) is not None:
-                        step_timeline.append(step)
-                    if (cpu := m.get("cpu_percent", None)) is not None:
-                        cpu_timeline.append(cpu)
-                    if (mem := m.get("memory_percent", None)) is not None:
-                        memory_timeline.append(mem)
-                    if (threads := m.get("num_threads", None)) is not None:
-                        thread_timeline.append(threads)
-                    if (io_read := m.get("read_bytes", None)) is not None:
-                        io_read_bytes_timeline.append(io_read)
-                    if (io_write := m.get("write_bytes", None)) is not None:
-                        io_write_bytes_timeline.append(io_write)
-
-                # Calculate process running time
-                running_time = 0
-                if len(process_metrics) >= 2:
-                    # Get start and end timestamps
-                    running_time = (
-                        process_metrics[-1]["timestamp"]
-                        - process_metrics[0]["timestamp"]
-                    )
-
                 # Calculate CPU, memory, and I/O statistics
-                calculated_stats = {
-                    "running_time": running_time,
-                    "avg_cpu_percent": statistics.mean(cpu_timeline)
-                    if cpu_timeline
-                    else 0.0,
-                    "stdev_cpu_percent": statistics.stdev(cpu_timeline)
-                    if len(cpu_timeline) > 1
-                    else 0.0,
-                    "avg_memory_percent": statistics.mean(memory_timeline)
-                    if memory_timeline
-                    else 0.0,
-                    "stdev_memory_percent": statistics.stdev(memory_timeline)
-                    if len(memory_timeline) > 1
-                    else 0.0,
-                    "avg_read_bytes": io_read_bytes_timeline[-1]
-                    - io_read_bytes_timeline[0]
-                    if len(io_read_bytes_timeline) > 1
-                    else 0.0,
-                    "avg_write_bytes": io_write_bytes_timeline[-1]
-                    - io_write_bytes_timeline[0]
-                    if len(io_write_bytes_timeline) > 1
-                    else 0.0,
-                    "max_num_threads": max(thread_timeline) if thread_timeline else 0,
-                }
+                calculated_stats = _calculate_process_statistics(process_metrics)
 
-                # Update process info with calculated stats
-                process_info.update(calculated_stats)
-
-                # Store updated process info
-                process_stats[pid] = process_info
+                # Store process info without the samples, keeping run result intact
+                process_stats[pid] = {
+                    key: val for key, val in process_info.items() if key != "metrics"
+                } | calculated_stats
 
         # Store process statistics in summary
         summary["processes"] = process_stats
@@ -198,8 +342,250 @@ def calculate_run_summary(run_result: dict) -> dict:
     return summary
 
 
+def calculate_set_summary(
+    set_id: int, arguments: dict, run_summaries: list[dict]
+) -> dict:
+    """Calculate summary statistics of a scenario set from its run summaries.
+
+    Args:
+        set_id: Scenario set number.
+        arguments: Scenario set arguments.
+        run_summaries: Run summaries of the set.
+
+    Returns:
+        Set summary.
+    """
+    total_runs = len(run_summaries)
+    success_rate = (
+        sum(1 for run in run_summaries if run["success"]) / total_runs
+        if total_runs > 0
+        else 0
+    )
+
+    # Calculate average and standard deviation of execution time for all runs
+    run_times = [run["run_time"] for run in run_summaries if "run_time" in run]
+    avg_run_time = sum(run_times) / len(run_times) if run_times else 0
+    stdev_run_time = _nanstdev(np.array(run_times, dtype=float))
+
+    return {
+        "set": set_id,
+        "arguments": arguments,
+        "total": total_runs,
+        "success": success_rate,
+        "avg_run_time": avg_run_time,
+        "stdev_run_time": stdev_run_time,
+        "runs": run_summaries,
+    }
+
+
+def _load_and_summarize(path: str) -> tuple[int, dict, dict]:
+    """Load a run result file and calculate its summary.
+
+    Args:
+        path: Path of the run result file.
+
+    Returns:
+        Tuple of set index, set arguments and run summary.
+    """
+    run_data = load_result(path)
+    return (
+        run_data.get("set", 0),
+        run_data.get("arguments", {}),
+        calculate_run_summary(run_data),
+    )
+
+
 # Generalized Chart Creation Functions
 
+# Maximum number of points of a line chart series
+MAX_CHART_POINTS = 3000
+
+# Number of points of a line chart series above which WebGL is used for rendering
+WEBGL_CHART_POINTS = 2000
+
+# Default colors of line chart series
+_DEFAULT_COLORS = ("#1f77b4", "#ff7f0e", "#2ca02c", "#d62728", "#9467bd", "#8c564b")
+
+
+def _lttb_indices(x: np.ndarray, y: np.ndarray, num_points: int) -> np.ndarray:
+    """Select points of a series using Largest-Triangle-Three-Buckets algorithm.
+
+    Args:
+        x: Array of x values.
+        y: Array of y values.
+        num_points: Number of points to select.
+
+    Returns:
+        Array of indices of the selected points.
+    """
+    size = len(x)
+    if num_points >= size or num_points < 3:
+        return np.arange(size)
+
+    bucket_size = (size - 2) / (num_points - 2)
+    indices = np.empty(num_points, dtype=int)
+    indices[0] = 0
+    indices[-1] = size - 1
+
+    selected = 0
+    for i in range(num_points - 2):
+        start = int(i * bucket_size) + 1
+        end = int((i + 1) * bucket_size) + 1
+        next_end = min(int((i + 2) * bucket_size) + 1, size)
+
+        # Average point of the next bucket
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+
+        # Point with the largest triangle area in the current bucket
+        areas = np.abs(
+            (x[selected] - avg_x) * (y[start:end] - y[selected])
+            - (x[selected] - x[start:end]) * (avg_y - y[selected])
+        )
+        selected = start + int(np.argmax(areas))
+        indices[i + 1] = selected
+
+    return indices
+
+
+@cache
+def _get_base_layout() -> dict:
+    """Return layout properties shared by all charts.
+
+    Plotly is imported on first use, so that loading this module for run
+    summaries does not pay for it.
+
+    Returns:
+        Base chart layout.
+    """
+    import plotly.io as pio
+
+    return {"template": pio.templates["plotly_white"].to_plotly_json()}
+
+
+def _get_layout(title: str, x_title: str = "", y_title: str = "", **kwargs) -> dict:
+    """Return layout of a chart.
+
+    Args:
+        title: Chart title.
+        x_title: X-axis title.
+        y_title: Y-axis title.
+        **kwargs: Additional layout properties.
+
+    Returns:
+        Chart layout.
+    """
+    return {
+        **_get_base_layout(),
+        "title": {"text": title},
+        "xaxis": {"title": {"text": x_title}},
+        "yaxis": {"title": {"text": y_title}},
+        **kwargs,
+    }
+
+
+def _to_typed_array(values: np.ndarray) -> dict | list:
+    """Convert an array to a plotly.js typed array.
+
+    Numeric arrays are encoded as base64 binary data, which avoids converting
+    every value into a JSON number. Single precision arrays are kept as such.
+    Other arrays are converted to lists.
+
+    Args:
+        values: Array of values.
+
+    Returns:
+        Typed array specification, or list of values.
+    """
+    values = np.asarray(values)
+    if values.dtype.kind not in "biuf":
+        return values.tolist()
+
+    # Integers are encoded with the smallest fitting type, other values as floats
+    dtype = np.dtype("<f4" if values.dtype == np.float32 else "<f8")
+    if values.dtype.kind in "biu" and len(values):
+        values = values.astype(np.int64)
+        int_dtype = np.result_type(
+            np.min_scalar_type(values.min()), np.min_scalar_type(values.max())
+        )
+        if int_dtype.itemsize <= 4:
+            dtype = int_dtype.newbyteorder("<")
+
+    data = np.ascontiguousarray(values, dtype=dtype).tobytes()
+    return {
+        "dtype": f"{dtype.kind}{dtype.itemsize}",
+        "bdata": base64.b64encode(data).decode("ascii"),
+    }
+
+
+def _get_chart_html(figure: dict, div_id: str) -> str:
+    """Return HTML fragment of a chart.
+
+    The figure is embedded as JSON, which is rendered by the Plotly library
+    included once in the report template. Figures are plain dictionaries, so
+    they are serialized without Plotly's property validation, using orjson if
+    available.
+
+    Args:
+        figure: Plotly figure dictionary with data and layout.
+        div_id: HTML div ID for the chart.
+
+    Returns:
+        str: HTML div containing the Plotly chart
+    """
+    import plotly.io as pio
+
+    figure = {**figure, "config": {"responsive": True}}
+    figure_json = pio.to_json(
+        figure, validate=False, engine="orjson" if orjson is not None else None
+    ).replace("</", "<\\/")
+    return (
+        f'<div id="{div_id}" class="plotly-graph-div"></div>\n'
+        f'<script>Plotly.newPlot("{div_id}", {figure_json});</script>'
+    )
+
+
+def _get_scatter_options(num_points: int) -> tuple[str, str]:
+    """Return scatter trace type and mode for a chart.
+
+    Long series are rendered with WebGL and without markers, as SVG rendering
+    slows down considerably with the number of points.
+
+    Args:
+        num_points: Maximum number of points of the chart series.
+
+    Returns:
+        Tuple of scatter trace type and mode.
+    """
+    if num_points > WEBGL_CHART_POINTS:
+        return "scattergl", "lines"
+
+    return "scatter", "lines+markers"
+
+
+def _downsample(
+    x_values: np.ndarray, y_values: np.ndarray, max_points: int = MAX_CHART_POINTS
+) -> tuple[np.ndarray, np.ndarray]:
+    """Downsample a series, if it has more points than the maximum.
+
+    Args:
+        x_values: Array of x values.
+        y_values: Array of y values.
+        max_points: Maximum number of points.
+
+    Returns:
+        Tuple of downsampled x and y values.
+    """
+    if len(y_values) <= max_points:
+        return x_values, y_values
+
+    indices = _lttb_indices(
+        np.asarray(x_values, dtype=float),
+        np.asarray(y_values, dtype=float),
+        max_points,
+    )
+    return x_values[indices], y_values[indices]
+
 
 def create_line_chart(
     data: Dict[str, List],
@@ -222,36 +608,37 @@ def create_line_chart(
     Returns:
         str: HTML div containing the Plotly chart
     """
-    if not data:
+    if not data or not any(data.values()):
         return f"<div>No data available for {title}</div>"
 
-    if colors is None:
-        colors = ["#1f77b4", "#ff7f0e", "#2ca02c", "#d62728", "#9467bd", "#8c564b"]
+    # Colors are assigned in series order, including skipped series
+    palette = cycle(colors or _DEFAULT_COLORS)
 
-    fig = go.Figure()
+    trace_type, mode = _get_scatter_options(
+        max(len(values) for values in data.values() if values)
+    )
 
-    for i, (series_name, values) in enumerate(data.items()):
+    traces = []
+    for series_name, values in data.items():
+        color = next(palette)
         if values:  # Only add non-empty series
-            x_values = list(range(len(values)))
-            fig.add_trace(
-                go.Scatter(
-                    x=x_values,
-                    y=values,
-                    mode="lines+markers",
-                    name=series_name,
-                    line=dict(color=colors[i % len(colors)], width=2),
-                )
+            x_values, values = _downsample(
+                np.arange(len(values)), np.asarray(values, dtype=np.float32)
+            )
+            traces.append(
+                {
+                    "type": trace_type,
+                    "x": _to_typed_array(x_values),
+                    "y": _to_typed_array(values),
+                    "mode": mode,
+                    "name": series_name,
+                    "line": {"color": color, "width": 2},
+                }
             )
 
-    fig.update_layout(
-        title=title,
-        xaxis_title=x_title,
-        yaxis_title=y_title,
-        hovermode="x",
-        template="plotly_white",
-    )
+    layout = _get_layout(title, x_title, y_title, hovermode="x")
 
-    return fig.to_html(include_plotlyjs=False, div_id=div_id)
+    return _get_chart_html({"data": traces, "layout": layout}, div_id)
 
 
 def create_bar_chart(
@@ -296,19 +683,24 @@ def create_bar_chart(
     if len(labels) != len(values):
         return f"<div>Labels and values length mismatch for {title}</div>"
 
+    # Skip charts without any non-zero bar
+    if not np.any(np.asarray(values, dtype=float)):
+        return f"<div>No non-zero data available for {title}</div>"
+
+    layout = _get_layout(title, x_title, y_title)
     if orientation == "v":
-        fig = go.Figure(data=[go.Bar(x=labels, y=values, marker_color=color)])
-        fig.update_layout(xaxis_tickangle=-45)
+        trace = {"type": "bar", "x": labels, "y": values, "marker": {"color": color}}
+        layout["xaxis"]["tickangle"] = -45
     else:
-        fig = go.Figure(
-            data=[go.Bar(x=values, y=labels, orientation="h", marker_color=color)]
-        )
+        trace = {
+            "type": "bar",
+            "x": values,
+            "y": labels,
+            "orientation": "h",
+            "marker": {"color": color},
+        }
 
-    fig.update_layout(
-        title=title, xaxis_title=x_title, yaxis_title=y_title, template="plotly_white"
-    )
-
-    return fig.to_html(include_plotlyjs=False, div_id=div_id)
+    return _get_chart_html({"data": [trace], "layout": layout}, div_id)
 
 
 def create_pie_chart(
@@ -348,23 +740,20 @@ def create_pie_chart(
         return f"<div>Labels and values length mismatch for {title}</div>"
 
     # Filter out zero values
-    filtered_data = [
-        (label, value) for label, value in zip(labels, values) if value > 0
-    ]
-    if not filtered_data:
+    values = np.asarray(values, dtype=float)
+    mask = values > 0
+    if not mask.any():
         return f"<div>No non-zero data available for {title}</div>"
 
-    filtered_labels, filtered_values = zip(*filtered_data)
-
-    fig = go.Figure(
-        data=[
-            go.Pie(labels=filtered_labels, values=filtered_values, marker_colors=colors)
-        ]
-    )
+    filtered_labels = [labels[i] for i in np.flatnonzero(mask)]
+    filtered_values = values[mask].tolist()
 
-    fig.update_layout(title=title, template="plotly_white")
+    trace = {"type": "pie", "labels": filtered_labels, "values": filtered_values}
+    if colors is not None:
+        trace["marker"] = {"colors": colors}
+    layout = {**_get_base_layout(), "title": {"text": title}}
 
-    return fig.to_html(include_plotlyjs=False, div_id=div_id)
+    return _get_chart_html({"data": [trace], "layout": layout}, div_id)
 
 
 def create_multi_series_line_chart(
@@ -378,7 +767,8 @@ def create_multi_series_line_chart(
     """Create a line chart with multiple series, each with their own x and y values.
 
     Each series can have different x-axis values and different lengths, allowing
-    for data points that start or end at arbitrary timepoints.
+    for data points that start or end at arbitrary timepoints. Series values
+    can be lists or NumPy arrays.
 
     Args:
         series_data: Dictionary where keys are series names and values are dictionaries
@@ -398,252 +788,73 @@ def create_multi_series_line_chart(
     if not series_data:
         return f"<div>No data available for {title}</div>"
 
-    if colors is None:
-        colors = ["#1f77b4", "#ff7f0e", "#2ca02c", "#d62728", "#9467bd", "#8c564b"]
-
-    fig = go.Figure()
-
-    for i, (series_name, data) in enumerate(series_data.items()):
-        if data:
-            # Handle backward compatibility: if data is a list, treat as y-values
-            if isinstance(data, list):
-                series_x = list(range(len(data)))
-                series_y = data
-            # Handle new format: data is a dict with 'x' and 'y' keys
-            elif isinstance(data, dict) and "x" in data and "y" in data:
-                x_values = data["x"]
-                y_values = data["y"]
-
-                if not x_values or not y_values:
-                    continue
-
-                # Take minimum length to ensure x and y have same number of points
-                min_length = min(len(x_values), len(y_values))
-                if min_length > 0:
-                    series_x = x_values[:min_length]
-                    series_y = y_values[:min_length]
-                else:
-                    continue
-            else:
-                # Skip invalid data format
+    # Colors are assigned in series order, including skipped series
+    palette = cycle(colors or _DEFAULT_COLORS)
+
+    # Collect valid series before building the figure
+    valid_series = []
+    for series_name, data in series_data.items():
+        color = next(palette)
+        if not data:
+            continue
+
+        # Handle backward compatibility: if data is a list, treat as y-values
+        if isinstance(data, list):
+            series_x = np.arange(len(data))
+            series_y = np.asarray(data, dtype=np.float32)
+        # Handle new format: data is a dict with 'x' and 'y' keys
+        elif isinstance(data, dict) and "x" in data and "y" in data:
+            x_values = np.asarray(data["x"])
+            y_values = np.asarray(data["y"], dtype=np.float32)
+
+            if not len(x_values) or not len(y_values):
                 continue
 
-            if series_x and series_y:
-                fig.add_trace(
-                    go.Scatter(
-                        x=series_x,
-                        y=series_y,
-                        mode="lines+markers",
-                        name=series_name,
-                        line=dict(color=colors[i % len(colors)], width=2),
-                    )
-                )
-
-    fig.update_layout(
-        title=title,
-        xaxis_title=x_title,
-        yaxis_title=y_title,
-        hovermode="x unified",
-        template="plotly_white",
-    )
-
-    return fig.to_html(include_plotlyjs=False, div_id=div_id)
+            # Take minimum length to ensure x and y have same number of points
+            min_length = min(len(x_values), len(y_values))
+            series_x = x_values[:min_length]
+            series_y = y_values[:min_length]
+        else:
+            # Skip invalid data format
+            continue
 
+        valid_series.append((series_name, color, series_x, series_y))
 
-def generate_html_report(
-    system_data: Dict, set_summaries: List[Dict], output_path: str = "report.html"
-) -> str:
-    """Generate a comprehensive HTML report with all charts.
+    if not valid_series:
+        return f"<div>No data available for {title}</div>"
 
-    Args:
-        run_data: Run-level monitoring data
-        system_data: System-level monitoring data
-        output_path: Path to save the HTML report
+    trace_type, mode = _get_scatter_options(
+        max(len(series_y) for _, _, _, series_y in valid_series)
+    )
 
-    Returns:
-        str: Path to the generated HTML report
-    """
-    div_id_counter = 1
-    # For each set summary
-    for set_summary in set_summaries:
-        # Get run summaries
-        run_summaries = set_summary.get("runs", [])
-
-        # For each run summary in a set
-        for run_summary in run_summaries:
-            # Init data structure
-            process_names = []
-            average_cpu_data = []
-            average_memory_data = []
-            average_write_bytes_data = []
-            average_read_bytes_data = []
-            cpu_series_data = {}
-            memory_series_data = {}
-
-            # Extract average system metrics from summary data
-            avg_system_cpu = run_summary.get("avg_system_cpu", [])
-            avg_system_memory = run_summary.get("avg_system_memory", {})
-            avg_system_disk = run_summary.get("avg_disk_bytes", {})
-            avg_system_net = run_summary.get("avg_net_bytes", {})
-
-            # Select only available, free, used, active, inactive, wired
-            memory_keys = ["available", "free", "used", "active", "inactive", "wired"]
-            filtered_avg_system_memory = {
-                key: avg_system_memory[key]
-                for key in memory_keys
-                if key in avg_system_memory
+    traces = []
+    for series_name, color, series_x, series_y in valid_series:
+        series_x, series_y = _downsample(series_x, series_y)
+        traces.append(
+            {
+                "type": trace_type,
+                "x": _to_typed_array(series_x),
+                "y": _to_typed_array(series_y),
+                "mode": mode,
+                "name": series_name,
+                "line": {"color": color, "width": 2},
             }
+        )
 
-            # Convert processes summary statistics into chart data
-            # For each process info in run summary
-            for pid, process_info in run_summary.get("processes", {}).items():
-                process_names.append(f"{process_info.get('name', None)} {pid}")
-                average_cpu_data.append(process_info.get("avg_cpu_percent", 0.0))
-                average_memory_data.append(process_info.get("avg_memory_percent", 0.0))
-                average_write_bytes_data.append(
-                    process_info.get("avg_write_bytes", 0.0) / 1024
-                )
-                average_read_bytes_data.append(
-                    process_info.get("avg_read_bytes", 0.0) / 1024
-                )
+    layout = _get_layout(title, x_title, y_title, hovermode="x unified")
 
-                # Transform process CPU usage over time into time series data for visualization
-                process_step_timeline = []
-                process_cpu_timeline = []
-                process_memory_timeline = []
-                for m in process_info.get("metrics", []):
-                    if (step := m.get("step", None)) is not None:
-                        process_step_timeline.append(step)
-                    if (cpu := m.get("cpu_percent", None)) is not None:
-                        process_cpu_timeline.append(cpu)
-                    if (mem := m.get("memory_percent", None)) is not None:
-                        process_memory_timeline.append(mem)
-                cpu_series_data[pid] = {
-                    "x": process_step_timeline,
-                    "y": process_cpu_timeline,
-                }
-                memory_series_data[pid] = {
-                    "x": process_step_timeline,
-                    "y": process_memory_timeline,
-                }
+    return _get_chart_html({"data": traces, "layout": layout}, div_id)
 
-                # Create charts
-                run_summary.update(
-                    {
-                        "charts": {
-                            "system_cpu_chart": create_bar_chart(
-                                labels=[
-                                    f"{i}" for i in range(1, len(avg_system_cpu) + 1)
-                                ],
-                                values=avg_system_cpu,
-                                title="Average System CPU Usage (per-core)",
-                                x_title="CPU Core",
-                                y_title="CPU Usage (%)",
-                                div_id=f"system-cpu-chart-{div_id_counter}",
-                                color="#1f77b4",
-                            ),
-                            "system_memory_chart": create_bar_chart(
-                                labels=[
-                                    f"{key}"
-                                    for key in filtered_avg_system_memory.keys()
-                                ],
-                                values=[
-                                    val
-                                    for key, val in filtered_avg_system_memory.items()
-                                ],
-                                title="Average System Memory Usage",
-                                x_title="Memory Block",
-                                y_title="Memory Usage (%)",
-                                div_id=f"system-memory-chart-{div_id_counter}",
-                                color="#ff7f0e",
-                            ),
-                            "system_disk_activity_chart": create_bar_chart(
-                                labels=[f"{key}" for key in avg_system_disk.keys()],
-                                values=[
-                                    val / 1024 for key, val in avg_system_disk.items()
-                                ],
-                                title="Average System Disk Activity",
-                                x_title="Disk Activity",
-                                y_title="Disk Usage (MB)",
-                                div_id=f"system-disk-chart-{div_id_counter}",
-                                color="#1f77b4",
-                            ),
-                            "system_net_activity_chart": create_bar_chart(
-                                labels=[f"{key}" for key in avg_system_net.keys()],
-                                values=[
-                                    val / 1024 for key, val in avg_system_net.items()
-                                ],
-                                title="Average System Network Activity",
-                                x_title="Net Activity",
-                                y_title="Net Traffic (MB)",
-                                div_id=f"system-net-chart-{div_id_counter}",
-                                color="#1f77b4",
-                            ),
-                            "process_cpu_chart": create_bar_chart(
-                                labels=process_names,
-                                values=average_cpu_data,
-                                title="Average CPU Usage by Process",
-                                x_title="Process (PID)",
-                                y_title="CPU Usage (%)",
-                                div_id=f"process-cpu-chart-{div_id_counter}",
-                                color="#ff7f0e",
-                            ),
-                            "process_memory_chart": create_bar_chart(
-                                labels=process_names,
-                                values=average_memory_data,
-                                title="Average Memory Usage by Process",
-                                x_title="Process (PID)",
-                                y_title="Memory Usage (%)",
-                                div_id=f"process-memory-chart-{div_id_counter}",
-                                color="#2ca02c",
-                            ),
-                            "process_write_bytes_chart": create_bar_chart(
-                                labels=process_names,
-                                values=average_write_bytes_data,
-                                title="Average I/O Write Bytes by Process",
-                                x_title="Process (PID)",
-                                y_title="Write (MB)",
-                                div_id=f"process-write-bytes-chart-{div_id_counter}",
-                                color="#2ca02c",
-                            ),
-                            "process_read_bytes_chart": create_bar_chart(
-                                labels=process_names,
-                                values=average_read_bytes_data,
-                                title="Average I/O Read Bytes by Process",
-                                x_title="Process (PID)",
-                                y_title="Read (MB)",
-                                div_id=f"process-read-bytes-chart-{div_id_counter}",
-                                color="#2ca02c",
-                            ),
-                            "process_timeline_chart": create_multi_series_line_chart(
-                                series_data=cpu_series_data,
-                                title="Process CPU Usage Timeline",
-                                x_title="Timestamp",
-                                y_title="CPU Usage (%)",
-                                div_id=f"process-timeline-chart-{div_id_counter}",
-                            ),
-                            "process_memory_timeline_chart": create_multi_series_line_chart(
-                                series_data=memory_series_data,
-                                title="Process Memory Usage Timeline",
-                                x_title="Timestamp",
-                                y_title="Memory Usage (%)",
-                                div_id=f"process-memory-timeline-chart-{div_id_counter}",
-                            ),
-                        }
-                    }
-                )
 
-                div_id_counter += 1
+@cache
+def _get_template() -> Template:
+    """Return the report template.
 
-    # Prepare template context
-    context = {
-        "title": "GeoBench Performance Report",
-        "generated_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-        "system_data": system_data,
-        "set_summaries": set_summaries,
-    }
+    The template is loaded and compiled once, and reused for later reports.
 
-    # Load and render template
+    Returns:
+        Report template.
+    """
     try:
         # For Python 3.9+, use importlib.resources
         from importlib import resources
@@ -658,7 +869,7 @@ def generate_html_report(
             with resources.open_text("geobench.templates", "report_template.html") as f:
                 template_content = f.read()
         env = Environment()
-        template = env.from_string(template_content)
+        return env.from_string(template_content)
     except (ImportError, ModuleNotFoundError):
         # Fallback for environments where importlib.resources might not work
         try:
@@ -668,18 +879,202 @@ def generate_html_report(
                 "geobench", "templates/report_template.html"
             ).decode("utf-8")
             env = Environment()
-            template = env.from_string(template_content)
+            return env.from_string(template_content)
         except Exception:
             # Final fallback to file system (for development)
             template_dir = os.path.join(os.path.dirname(__file__), "templates")
             env = Environment(loader=FileSystemLoader(template_dir))
-            template = env.get_template("report_template.html")
+            return env.get_template("report_template.html")
+
+
+def _build_run_charts(run_summary: dict, chart_id: int) -> dict | None:
+    """Build the charts of a run summary.
+
+    Args:
+        run_summary: Run summary.
+        chart_id: Identifier used to create unique chart element ids.
+
+    Returns:
+        Dictionary of chart HTML fragments, or None if the run has no processes.
+    """
+    # Init data structure
+    process_names = []
+    average_cpu_data = []
+    average_memory_data = []
+    average_write_bytes_data = []
+    average_read_bytes_data = []
+    cpu_series_data = {}
+    memory_series_data = {}
+
+    # Extract average system metrics from summary data
+    avg_system_cpu = run_summary.get("avg_system_cpu", [])
+    avg_system_memory = run_summary.get("avg_system_memory", {})
+    avg_system_disk = run_summary.get("avg_disk_bytes", {})
+    avg_system_net = run_summary.get("avg_net_bytes", {})
+
+    # Select only available, free, used, active, inactive, wired
+    memory_keys = ["available", "free", "used", "active", "inactive", "wired"]
+    filtered_avg_system_memory = {
+        key: avg_system_memory[key] for key in memory_keys if key in avg_system_memory
+    }
+
+    # Convert processes summary statistics into chart data
+    # For each process info in run summary
+    for pid, process_info in run_summary.get("processes", {}).items():
+        process_names.append(f"{process_info.get('name', None)} {pid}")
+        average_cpu_data.append(process_info.get("avg_cpu_percent", 0.0))
+        average_memory_data.append(process_info.get("avg_memory_percent", 0.0))
+        average_write_bytes_data.append(process_info.get("avg_write_bytes", 0.0) / 1024)
+        average_read_bytes_data.append(process_info.get("avg_read_bytes", 0.0) / 1024)
+
+        # Use process timelines calculated with the summary for visualization
+        timelines = process_info.get("timelines", {})
+        cpu_series_data[pid] = {
+            "x": timelines.get("step", []),
+            "y": timelines.get("cpu_percent", []),
+        }
+        memory_series_data[pid] = {
+            "x": timelines.get("step", []),
+            "y": timelines.get("memory_percent", []),
+        }
+
+    if not process_names:
+        return None
+
+    # Create charts
+    return {
+        "system_cpu_chart": create_bar_chart(
+            labels=[f"{i}" for i in range(1, len(avg_system_cpu) + 1)],
+            values=avg_system_cpu,
+            title="Average System CPU Usage (per-core)",
+            x_title="CPU Core",
+            y_title="CPU Usage (%)",
+            div_id=f"system-cpu-chart-{chart_id}",
+            color="#1f77b4",
+        ),
+        "system_memory_chart": create_bar_chart(
+            labels=[f"{key}" for key in filtered_avg_system_memory.keys()],
+            values=[val for key, val in filtered_avg_system_memory.items()],
+            title="Average System Memory Usage",
+            x_title="Memory Block",
+            y_title="Memory Usage (%)",
+            div_id=f"system-memory-chart-{chart_id}",
+            color="#ff7f0e",
+        ),
+        "system_disk_activity_chart": create_bar_chart(
+            labels=[f"{key}" for key in avg_system_disk.keys()],
+            values=[val / 1024 for key, val in avg_system_disk.items()],
+            title="Average System Disk Activity",
+            x_title="Disk Activity",
+            y_title="Disk Usage (MB)",
+            div_id=f"system-disk-chart-{chart_id}",
+            color="#1f77b4",
+        ),
+        "system_net_activity_chart": create_bar_chart(
+            labels=[f"{key}" for key in avg_system_net.keys()],
+            values=[val / 1024 for key, val in avg_system_net.items()],
+            title="Average System Network Activity",
+            x_title="Net Activity",
+            y_title="Net Traffic (MB)",
+            div_id=f"system-net-chart-{chart_id}",
+            color="#1f77b4",
+        ),
+        "process_cpu_chart": create_bar_chart(
+            labels=process_names,
+            values=average_cpu_data,
+            title="Average CPU Usage by Process",
+            x_title="Process (PID)",
+            y_title="CPU Usage (%)",
+            div_id=f"process-cpu-chart-{chart_id}",
+            color="#ff7f0e",
+        ),
+        "process_memory_chart": create_bar_chart(
+            labels=process_names,
+            values=average_memory_data,
+            title="Average Memory Usage by Process",
+            x_title="Process (PID)",
+            y_title="Memory Usage (%)",
+            div_id=f"process-memory-chart-{chart_id}",
+            color="#2ca02c",
+        ),
+        "process_write_bytes_chart": create_bar_chart(
+            labels=process_names,
+            values=average_write_bytes_data,
+            title="Average I/O Write Bytes by Process",
+            x_title="Process (PID)",
+            y_title="Write (MB)",
+            div_id=f"process-write-bytes-chart-{chart_id}",
+            color="#2ca02c",
+        ),
+        "process_read_bytes_chart": create_bar_chart(
+            labels=process_names,
+            values=average_read_bytes_data,
+            title="Average I/O Read Bytes by Process",
+            x_title="Process (PID)",
+            y_title="Read (MB)",
+            div_id=f"process-read-bytes-chart-{chart_id}",
+            color="#2ca02c",
+        ),
+        "process_timeline_chart": create_multi_series_line_chart(
+            series_data=cpu_series_data,
+            title="Process CPU Usage Timeline",
+            x_title="Timestamp",
+            y_title="CPU Usage (%)",
+            div_id=f"process-timeline-chart-{chart_id}",
+        ),
+        "process_memory_timeline_chart": create_multi_series_line_chart(
+            series_data=memory_series_data,
+            title="Process Memory Usage Timeline",
+            x_title="Timestamp",
+            y_title="Memory Usage (%)",
+            div_id=f"process-memory-timeline-chart-{chart_id}",
+        ),
+    }
 
-    html_content = template.render(context)
 
-    # Write to file
+def generate_html_report(
+    system_data: Dict, set_summaries: List[Dict], output_path: str = "report.html"
+) -> str:
+    """Generate a comprehensive HTML report with all charts.
+
+    Args:
+        run_data: Run-level monitoring data
+        system_data: System-level monitoring data
+        output_path: Path to save the HTML report
+
+    Returns:
+        str: Path to the generated HTML report
+    """
+    # Collect run summaries of all sets
+    run_summaries = [
+        run_summary
+        for set_summary in set_summaries
+        for run_summary in set_summary.get("runs", [])
+    ]
+
+    # Build the charts of the runs
+    for chart_id, run_summary in enumerate(run_summaries, 1):
+        charts = _build_run_charts(run_summary, chart_id)
+        if charts is not None:
+            run_summary["charts"] = charts
+
+    from plotly.offline import get_plotlyjs_version
+
+    # Prepare template context
+    context = {
+        "title": "GeoBench Performance Report",
+        "generated_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "system_data": system_data,
+        "set_summaries": set_summaries,
+        "plotlyjs_version": get_plotlyjs_version(),
+    }
+
+    # Load and render template
+    template = _get_template()
+
+    # Render to file
     with open(output_path, "w", encoding="utf-8") as f:
-        f.write(html_content)
+        template.stream(context).dump(f)
 
     return output_path
 
@@ -699,60 +1094,23 @@ if __name__ == "__main__":
     report_dir_path = sys.argv[1]
     output_path = sys.argv[2]
 
-    run_report_path = []
-    system_report_path = None
-    # Iterate through sub directory
-    for root, dirs, files in os.walk(report_dir_path):
-        for filename in files:
-            if filename == "result.json":
-                # Check if it is in root directory
-                if root == report_dir_path:
-                    system_report_path = os.path.join(root, filename)
-                else:
-                    run_report_path.append(os.path.join(root, filename))
-
-    if system_report_path := os.path.join(report_dir_path, "result.json"):
-        with open(system_report_path, "r") as f:
-            system_data = json.load(f)
-
-    # Iterate for directory inside report_dir_path (one-level)
-    set_summaries = []
-    for set_items in os.listdir(report_dir_path):
-        if os.path.isdir(os.path.join(report_dir_path, set_items)):
-            set_summary = {"set": 0, "arguments": {}, "runs": []}
-
-            sorted_listdir = sorted(
-                os.listdir(os.path.join(report_dir_path, set_items))
-            )
-            for run_items in sorted_listdir:
-                if os.path.isdir(os.path.join(report_dir_path, set_items, run_items)):
-                    if run_path := os.path.join(
-                        report_dir_path, set_items, run_items, "result.json"
-                    ):
-                        with open(run_path, "r") as f:
-                            run_data = json.load(f)
-                            set_summary["set"] = run_data.get("set", 0)
-                            set_summary["arguments"] = run_data.get("arguments", {})
-                            summary = calculate_run_summary(run_data)
-                            set_summary["runs"].append(summary)
-
-            runs_len = len(set_summary["runs"])
-            set_summary["total"] = runs_len
-            set_summary["success"] = (
-                (sum(1 for run in set_summary["runs"] if run["success"]) / runs_len)
-                if runs_len > 0
-                else 0
-            )
-
-            run_time_list = [
-                run["run_time"] for run in set_summary["runs"] if "run_time" in run
-            ]
-            avg_run_time = statistics.mean(run_time_list) if run_time_list else 0
-            stdev_run_time = (
-                statistics.stdev(run_time_list) if len(run_time_list) > 1 else 0
-            )
-            set_summary["avg_run_time"] = avg_run_time
-            set_summary["stdev_run_time"] = stdev_run_time
+    # Load and summarize result files in parallel processes
+    with ProcessPoolExecutor() as executor:
+        if system_report_path := os.path.join(report_dir_path, "result.json"):
+            system_future = executor.submit(load_result, system_report_path)
+
+        # Iterate for directory inside report_dir_path (one-level)
+        set_summaries = []
+        for _, run_paths in _scan_results(report_dir_path):
+            run_set, run_arguments, run_summaries = 0, {}, []
+            for run_set, run_arguments, summary in executor.map(
+                _load_and_summarize, run_paths
+            ):
+                run_summaries.append(summary)
+
+            set_summary = calculate_set_summary(run_set, run_arguments, run_summaries)
             set_summaries.append(set_summary)
 
+        system_data = system_future.result()
+
     generate_html_report(system_data, set_summaries, output_path)
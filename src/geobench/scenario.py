@@ -1,27 +1,43 @@
 """Scenario module."""
 
-import copy
 import inspect
 import itertools
 import json
 import os
 import re
 import shutil
-import statistics
 import time
-import traceback
+from concurrent.futures import ThreadPoolExecutor
 
-import yaml
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from .cache import clear_cache
 from .executor import get_executors
 from .monitor import get_system_info, monitor_system, monitor_process
-from .report import calculate_run_summary, generate_html_report
 
 import logging
 
 logger = logging.getLogger(__name__)
 
+_RE_NONWORD = re.compile(r"[^\w-]")
+_RE_DASHES = re.compile(r"-+")
+
+
+def _link_or_copy(path: str, dir: str):
+    """Hard link a file into a directory, or copy it if linking is not possible.
+
+    Args:
+        path: File path.
+        dir: Target directory path.
+    """
+    try:
+        os.link(path, os.path.join(dir, os.path.basename(path)))
+    except OSError:
+        shutil.copy(path, dir)
+
 
 class Scenario:
     """Scenario class."""
@@ -35,6 +51,7 @@ class Scenario:
         outputs: list | dict = None,
         arguments: list | dict = None,
         repeat: int = 1,
+        warmup: int = 0,
         wait: float = 2.0,
         monitor: float = 2.0,
         run_wait: float | None = None,
@@ -42,6 +59,7 @@ class Scenario:
         system_wait: float | None = None,
         system_monitor: float | None = None,
         archive: str = "both",
+        link_inputs: bool = False,
         clean_outputs: bool = False,
         workdir: str | None = None,
         basedir: str | None = None,
@@ -59,6 +77,7 @@ class Scenario:
             outputs: Optional list or dictionary of output files.
             arguments: Optional list or dictionary of arguments.
             repeat: Number of repeats.
+            warmup: Number of warmup runs before the benchmark runs. Their results are discarded.
             wait: Wait time before and after in seconds.
             monitor: Monitoring time before and after in seconds.
             run_wait: Wait time before and after each run in seconds. Defaults to wait time.
@@ -66,6 +85,8 @@ class Scenario:
             system_wait: Wait time before and after all runs in seconds. Defaults to wait time.
             system_monitor: Monitoring time before and after all runs in seconds. Defaults to monitor time.
             archive: File types to archive. Options are 'none', 'both', 'input', 'output'.
+            link_inputs: Hard link archived input files instead of copying them. Only safe if
+                the runs do not modify the input files, as the links share their contents.
             clean_outputs: Clean outputs at the end of each run.
             workdir: Working directory path. It is also used as the root path of the input files.
                 Defaults to the current working directory.
@@ -104,6 +125,7 @@ class Scenario:
         self.outputs = outputs or {}
         self.arguments = arguments or {}
         self.repeat = repeat or 1
+        self.warmup = warmup or 0
         self.wait = wait or 0.0
         self.monitor = monitor or 0.0
         self.run_wait = run_wait if run_wait is not None else self.wait
@@ -113,6 +135,7 @@ class Scenario:
             system_monitor if system_monitor is not None else self.monitor
         )
         self.archive = archive or "none"
+        self.link_inputs = link_inputs
         self.clean_outputs = clean_outputs
         self.telemetry = telemetry
 
@@ -133,8 +156,8 @@ class Scenario:
                 raise ValueError(f"Invalid base directory: {basedir}")
 
         # Set output directory
-        self.outdir = outdir or re.sub(
-            r"-+", "-", re.sub(r"[^\w-]", "-", self.name.lower())
+        self.outdir = outdir or _RE_DASHES.sub(
+            "-", _RE_NONWORD.sub("-", self.name.lower())
         ).strip("-")
         if not os.path.isabs(self.outdir):
             self.outdir = os.path.join(self.basedir, self.outdir)
@@ -147,7 +170,10 @@ class Scenario:
             if not os.path.isdir(self.venv):
                 raise ValueError(f"Invalid virtual environment: {venv}")
 
-        if isinstance(self.outputs, dict):
+        multi_input = isinstance(self.inputs, dict)
+        multi_output = isinstance(self.outputs, dict)
+
+        if multi_output:
             outputs = []
             for val in self.outputs.values():
                 if isinstance(val, list):
@@ -160,8 +186,6 @@ class Scenario:
         if not all(isinstance(item, str) for item in outputs):
             raise ValueError("Invalid outputs")
 
-        multi_input = isinstance(self.inputs, dict)
-
         if isinstance(self.arguments, list):
             args = {key: val for key, val in enumerate(self.arguments)}
         else:
@@ -170,39 +194,76 @@ class Scenario:
         args = (
             args
             | (self.inputs if multi_input else {})
-            | (self.outputs if isinstance(self.outputs, dict) else {})
+            | (self.outputs if multi_output else {})
         )
-        args = {
-            key: val if isinstance(val, list) else [val] for key, val in args.items()
-        }
 
-        if args:
+        # A single set is required if all arguments are scalar
+        if not any(isinstance(val, list) for val in args.values()):
+            sets = [args]
+
+        else:
+            args = {
+                key: val if isinstance(val, list) else [val]
+                for key, val in args.items()
+            }
             keys, vals = zip(*args.items())
             sets = [dict(zip(keys, items)) for items in itertools.product(*vals)]
 
-        else:
-            sets = [{}]
+        input_keys = tuple(self.inputs.keys()) if multi_input else ()
+        output_keys = tuple(self.outputs.keys()) if multi_output else ()
+        inputs = self.inputs if isinstance(self.inputs, list) else [self.inputs]
 
         self.sets = []
         for args in sets:
             data = {}
 
-            if multi_input:
-                data["inputs"] = [args[key] for key in self.inputs.keys()]
-            else:
-                data["inputs"] = (
-                    self.inputs if isinstance(self.inputs, list) else [self.inputs]
-                )
-
+            data["inputs"] = (
+                [args[key] for key in input_keys] if multi_input else inputs
+            )
             data["outputs"] = outputs
             data["arguments"] = args
 
+            # Set absolute input and output file paths
+            data["abs_inputs"] = {
+                key: self._get_abs_path(args[key]) for key in input_keys
+            }
+            data["abs_outputs"] = {
+                key: self._get_abs_path(args[key]) for key in output_keys
+            }
+
             self.sets.append(data)
 
-    def _store(self, filename: str, content: dict):
+    def _get_abs_path(self, path: str) -> str:
+        """Return normalized absolute path of a file relative to the working directory.
+
+        Args:
+            path: File path.
+
+        Returns:
+            Absolute file path.
+        """
+        return os.path.normpath(
+            path if os.path.isabs(path) else os.path.join(self.workdir, path)
+        )
+
+    def _store(self, filename: str, content: dict, sync: bool = False):
         path = os.path.join(self.outdir, filename)
-        with open(path, "w", encoding="utf-8") as file:
-            json.dump(content, file, ensure_ascii=False, indent=2)
+        with open(path, "wb") as file:
+            if orjson is not None:
+                file.write(
+                    orjson.dumps(
+                        content, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                    )
+                )
+            else:
+                file.write(
+                    json.dumps(content, ensure_ascii=False, indent=2).encode("utf-8")
+                )
+
+            # Write the file to disk, if required
+            if sync:
+                file.flush()
+                os.fsync(file.fileno())
 
     def _store_result(self, result: dict):
         self._store("result.json", result)
@@ -226,15 +287,224 @@ class Scenario:
 
         return out
 
-    def benchmark(self, clean: bool = False) -> dict:
+    def _get_run_arguments(self, data: dict) -> dict:
+        """Return run arguments with absolute input and output file paths.
+
+        Args:
+            data: Scenario set data.
+
+        Returns:
+            Run arguments.
+        """
+        return data["arguments"] | data["abs_inputs"] | data["abs_outputs"]
+
+    def _clean_outputs(self, data: dict):
+        """Remove the output files of a scenario set.
+
+        Args:
+            data: Scenario set data.
+        """
+        for path in data["abs_outputs"].values():
+            if not os.path.exists(path):
+                continue
+            logger.info("Removing output file %s", path)
+            for output_path in self.get_related_files(path):
+                if output_path != path and not os.path.exists(output_path):
+                    continue
+                try:
+                    os.remove(output_path)
+                except Exception as err:
+                    logger.error(
+                        "Error removing output file %s: %s",
+                        output_path,
+                        err,
+                    )
+
+    def _execute_run(
+        self,
+        executor,
+        set_id: int,
+        run_id: int,
+        data: dict,
+        abs_path: str,
+        parallel: int = 1,
+    ) -> dict:
+        """Execute a single run of a scenario set.
+
+        Args:
+            executor: Executor to run the command.
+            set_id: Scenario set number.
+            run_id: Run number.
+            data: Scenario set data.
+            abs_path: Output directory path of the run.
+            parallel: Number of runs executed in parallel with this run. If greater
+                than 1, system cleanup, idle waits and baseline and endline monitoring
+                are skipped, as they would overlap with the other runs.
+
+        Returns:
+            Run summary.
+        """
+        logger.info("Scenario set %s, run %s:", set_id, run_id)
+
+        os.makedirs(abs_path, exist_ok=True)
+
+        result_path = os.path.join(abs_path, "result.json")
+
+        out = {
+            "set": set_id,
+            "run": run_id,
+            "arguments": data["arguments"],
+        }
+
+        # Mark runs that overlapped with other runs
+        if parallel > 1:
+            out["parallel"] = parallel
+
+        try:
+            if parallel == 1:
+                # Perform system cleanup
+                logger.info("Clearing system caches.")
+                clear_cache()
+
+                # Idle wait before the run, if required
+                if self.run_wait:
+                    logger.info("Waiting %s s before the run.", self.run_wait)
+                    time.sleep(self.run_wait)
+
+            # Perform baseline monitoring before the run, if required
+            if parallel == 1 and self.run_monitor:
+                logger.info("Baseline monitoring for %s s.", self.run_monitor)
+                out["baseline"] = monitor_system(self.run_monitor)
+
+            # Set run-specific arguments
+            args = self._get_run_arguments(data)
+
+            # Perform the run
+            logger.info("Executing the run.")
+
+            out["start_time"] = time.time()
+            out["finished"] = False
+            out["success"] = False
+
+            try:
+                process = executor.execute(self.command, args)
+                out["pid"] = process.pid
+
+                metrics = monitor_process(
+                    process,
+                    telemetry=self.telemetry,
+                )
+
+                out.update(metrics)
+
+                out["finished"] = True
+                out["success"] = process.returncode == 0
+
+                if process.returncode:
+                    logger.error(
+                        "Command '%s' failed with exit code: %s",
+                        self.command,
+                        process.returncode,
+                    )
+                    out["returncode"] = process.returncode
+
+            except Exception as err:
+                logger.exception("Command '%s' failed with error", self.command)
+                out["error"] = str(err)
+
+            out["end_time"] = time.time()
+
+            # Idle wait after the run, if required
+            if parallel == 1 and self.run_wait:
+                logger.info("Waiting %s s after the run.", self.run_wait)
+                time.sleep(self.run_wait)
+
+            # Perform endline monitoring after the run, if required
+            if parallel == 1 and self.run_monitor:
+                logger.info("Endline monitoring for %s s.", self.run_monitor)
+                out["endline"] = monitor_system(self.run_monitor)
+
+        finally:
+            # Store run results, including partial results on failure
+            # REMARK: The file is synced to disk before caches are cleared for the
+            # next run.
+            self._store(result_path, out, sync=True)
+
+        # Store input files in the output directory.
+        if self.archive in ["both", "input"]:
+            for path in data["abs_inputs"].values():
+                if not os.path.exists(path):
+                    continue
+                logger.info("Archiving input file %s", path)
+                for input_path in self.get_related_files(path):
+                    if input_path != path and not os.path.exists(input_path):
+                        continue
+                    try:
+                        if self.link_inputs:
+                            _link_or_copy(input_path, abs_path)
+                        else:
+                            shutil.copy(input_path, abs_path)
+                    except shutil.SameFileError:
+                        pass
+                    except Exception as err:
+                        logger.error(
+                            "Error copying input file %s to %s: %s",
+                            input_path,
+                            abs_path,
+                            err,
+                        )
+
+        # Store output files in the output directory, if required.
+        if self.archive in ["both", "output"]:
+            for path in data["abs_outputs"].values():
+                if not os.path.exists(path):
+                    continue
+                logger.info("Archiving output file %s", path)
+                for output_path in self.get_related_files(path):
+                    if output_path != path and not os.path.exists(output_path):
+                        continue
+                    try:
+                        shutil.copy(output_path, abs_path)
+                    except shutil.SameFileError:
+                        pass
+                    except Exception as err:
+                        logger.error(
+                            "Error copying output file %s to %s: %s",
+                            output_path,
+                            abs_path,
+                            err,
+                        )
+
+        # Clean outputs if required
+        if self.clean_outputs:
+            self._clean_outputs(data)
+
+        # Calculate run summary
+        from .report import calculate_run_summary
+
+        return calculate_run_summary(out)
+
+    def benchmark(self, clean: bool = False, parallel: int = 1) -> dict:
         """Benchmark the scenario.
 
         Args:
             clean: If True, clean the output directory before running the benchmark.
+            parallel: Number of runs of a scenario set to execute in parallel. Parallel
+                runs skip per-run system cleanup, idle waits and baseline and endline
+                monitoring. They are not supported for scenarios with outputs, as the
+                runs would overwrite each other's outputs.
 
         Returns:
             Benchmarking results.
+
+        Raises:
+            ValueError: if parallel runs are requested for a scenario with outputs.
         """
+        if parallel > 1 and self.outputs:
+            raise ValueError(
+                "Parallel runs are not supported for scenarios with outputs"
+            )
+
         result = {}
         config = {
             "workdir": self.workdir,
@@ -242,23 +512,22 @@ class Scenario:
         }
 
         try:
-            print(f"Running scenario {self.name}.")
+            logger.info("Running scenario %s.", self.name)
 
             num_sets = len(self.sets)
             num_runs = num_sets * self.repeat
-            print(
-                "{} scenario {} with {} {}, {} {} in total.".format(
-                    num_sets,
-                    "sets" if num_sets > 1 else "set",
-                    self.repeat,
-                    "repeats" if self.repeat > 1 else "repeat",
-                    num_runs,
-                    "runs" if num_runs > 1 else "run",
-                )
+            logger.info(
+                "%s scenario %s with %s %s, %s %s in total.",
+                num_sets,
+                "sets" if num_sets > 1 else "set",
+                self.repeat,
+                "repeats" if self.repeat > 1 else "repeat",
+                num_runs,
+                "runs" if num_runs > 1 else "run",
             )
 
             # Create executor
-            print(f"Creating {self.type} executor.")
+            logger.info("Creating %s executor.", self.type)
             executor_cls = get_executors().get(self.type)
             if not executor_cls:
                 raise ValueError(f"Invalid executor type: {self.type}")
@@ -266,11 +535,11 @@ class Scenario:
             executor = executor_cls(config)
 
             # Set up output directory
-            print(f"Setting up output directory {self.outdir}.")
+            logger.info("Setting up output directory %s.", self.outdir)
             if os.path.exists(self.outdir):
                 if os.path.isdir(self.outdir):
                     if not clean:
-                        print("Output directory exists, aborting.")
+                        logger.error("Output directory exists, aborting.")
                         return {}
                     else:
                         logger.debug(
@@ -278,295 +547,157 @@ class Scenario:
                         )
                         shutil.rmtree(self.outdir)
                 else:
-                    print("Invalid output directory, aborting.")
+                    logger.error("Invalid output directory, aborting.")
                     return {}
             os.makedirs(self.outdir)
 
             # Store executor configuration
-            print("Storing executor configuration.")
+            logger.info("Storing executor configuration.")
             result["config"] = executor.config
-            self._store_result(result)
+
+            # Store number of parallel runs, as the runs overlapped
+            if parallel > 1:
+                result["parallel"] = parallel
 
             # Perform system cleanup
-            print("Clearing system caches.")
+            logger.info("Clearing system caches.")
             clear_cache()
 
             # Idle wait before the runs, if required
             # REMARK: Allowing some time after cleanup is recommended.
             if self.system_wait:
-                print(f"Waiting {self.system_wait} s before the scenario runs.")
+                logger.info("Waiting %s s before the scenario runs.", self.system_wait)
                 time.sleep(self.system_wait)
 
             # Store system information
-            print("Storing system information.")
+            logger.info("Storing system information.")
             result["system"] = get_system_info()
-            self._store_result(result)
 
             # Perform baseline monitoring before the runs, if required
             if self.system_monitor:
-                print(f"Baseline monitoring for {self.system_monitor} s.")
+                logger.info("Baseline monitoring for %s s.", self.system_monitor)
                 result["baseline"] = monitor_system(self.system_monitor)
-                self._store_result(result)
+
+            # Perform warmup runs, if required
+            if self.warmup:
+                logger.info("Performing %s warmup run(s).", self.warmup)
+                args = self._get_run_arguments(self.sets[0])
+                for _ in range(self.warmup):
+                    try:
+                        returncode = executor.execute(self.command, args).wait()
+                        if returncode:
+                            logger.warning(
+                                "Warmup run failed with exit code: %s", returncode
+                            )
+                    except Exception as err:
+                        logger.warning("Warmup run failed: %s", err)
+
+                    # Remove warmup outputs, as they are not part of the results
+                    self._clean_outputs(self.sets[0])
+                logger.info("Warmup completed.")
 
             # Start execution loop
-            print("Executing the runs.")
-            start_time = time.time()
+            if parallel > 1:
+                logger.info("Executing the runs with %s parallel workers.", parallel)
+            else:
+                logger.info("Executing the runs.")
+            start_ns = time.perf_counter_ns()
 
-            len_sets = len(str(num_sets))
-            len_runs = len(str(self.repeat))
+            # Set directory name formats padded to the number of sets and runs
+            set_format = f"set_{{:0{len(str(num_sets))}d}}"
+            run_format = f"run_{{:0{len(str(self.repeat))}d}}"
 
             set_summaries = []
             # For each scenario set
             for i, data in enumerate(self.sets):
                 set_id = i + 1
-
-                # Reset run summaries list
-                run_summaries = []
-                # For each repetation
-                for j in range(self.repeat):
-                    run_id = j + 1
-
-                    print(f"Scenario set {set_id}, run {run_id}:")
-
-                    path = os.path.join(
-                        f"set_{set_id:0{len_sets}d}",
-                        f"run_{run_id:0{len_runs}d}",
+                set_path = os.path.join(self.outdir, set_format.format(set_id))
+
+                # Set runs with their output directories
+                runs = [
+                    (
+                        set_id,
+                        run_id,
+                        data,
+                        os.path.join(set_path, run_format.format(run_id)),
                     )
+                    for run_id in range(1, self.repeat + 1)
+                ]
 
-                    abs_path = os.path.join(self.outdir, path)
-                    os.makedirs(abs_path, exist_ok=True)
-
-                    result_path = os.path.join(abs_path, "result.json")
-
-                    out = {
-                        "set": set_id,
-                        "run": run_id,
-                        "arguments": data["arguments"],
-                    }
-
-                    # Perform system cleanup
-                    print("Clearing system caches.")
-                    clear_cache()
-
-                    # Idle wait before the run, if required
-                    if self.run_wait:
-                        print(f"Waiting {self.run_wait} s before the run.")
-                        time.sleep(self.run_wait)
-
-                    # Perform baseline monitoring before the run, if required
-                    if self.run_monitor:
-                        print(f"Baseline monitoring for {self.run_monitor} s.")
-                        out["baseline"] = monitor_system(self.run_monitor)
-                        self._store(result_path, out)
-
-                    # Modify run-specific arguments
-                    args = copy.deepcopy(data["arguments"])
-
-                    # Set input file paths
-                    if isinstance(self.inputs, dict):
-                        logger.debug("Modifying input paths")
-                        for key in self.inputs.keys():
-                            args[key] = os.path.normpath(
-                                args[key]
-                                if os.path.isabs(args[key])
-                                else os.path.join(self.workdir, args[key])
-                            )
-
-                    # Set output file paths
-                    if isinstance(self.outputs, dict):
-                        logger.debug("Modifying output paths")
-                        for key in self.outputs.keys():
-                            args[key] = os.path.normpath(
-                                args[key]
-                                if os.path.isabs(args[key])
-                                else os.path.join(self.workdir, args[key])
+                # Perform the runs
+                if parallel > 1:
+                    with ThreadPoolExecutor(max_workers=parallel) as pool:
+                        futures = [
+                            pool.submit(
+                                self._execute_run, executor, *run, parallel=parallel
                             )
+                            for run in runs
+                        ]
+                        run_summaries = [future.result() for future in futures]
+                else:
+                    run_summaries = [self._execute_run(executor, *run) for run in runs]
 
-                    # Perform the run
-                    print("Executing the run.")
-
-                    out["start_time"] = time.time()
-                    out["finished"] = False
-                    out["success"] = False
-
-                    try:
-                        process = executor.execute(self.command, args)
-                        out["pid"] = process.pid
-
-                        metrics = monitor_process(
-                            process,
-                            telemetry=self.telemetry,
-                        )
-
-                        out.update(metrics)
-
-                        out["finished"] = True
-                        out["success"] = process.returncode == 0
+                # Generate summary of the set runs
+                from .report import calculate_set_summary
 
-                        if process.returncode:
-                            print(
-                                f"Command '{self.command}' failed with exit code: {process.returncode}"
-                            )
-                            out["returncode"] = process.returncode
-
-                    except Exception as err:
-                        print(f"Command '{self.command}' failed with error: {err}")
-                        print("Full stack trace:")
-                        traceback.print_exception(err)
-                        out["error"] = str(err)
-
-                    out["end_time"] = time.time()
-
-                    self._store(result_path, out)
-
-                    # Idle wait after the run, if required
-                    if self.run_wait:
-                        print(f"Waiting {self.run_wait} s after the run.")
-                        time.sleep(self.run_wait)
-
-                    # Perform endline monitoring after the run, if required
-                    if self.run_monitor:
-                        print(f"Endline monitoring for {self.run_monitor} s.")
-                        out["endline"] = monitor_system(self.run_monitor)
-                        self._store(result_path, out)
-
-                    # Store input files in the output directory.
-                    if self.archive in ["both", "input"]:
-                        for key in self.inputs.keys():
-                            input_path = args[key]
-                            if not os.path.exists(input_path):
-                                continue
-                            print(f"Archiving input file {input_path}")
-                            for input_path in self.get_related_files(input_path):
-                                if not os.path.exists(input_path):
-                                    continue
-                                try:
-                                    shutil.copy(input_path, abs_path)
-                                except shutil.SameFileError:
-                                    pass
-                                except Exception as err:
-                                    logger.error(
-                                        "Error copying input file %s to %s: %s",
-                                        input_path,
-                                        abs_path,
-                                        err,
-                                    )
-
-                    # Store output files in the output directory, if required.
-                    if self.archive in ["both", "output"]:
-                        for key in self.outputs.keys():
-                            output_path = args[key]
-                            if not os.path.exists(output_path):
-                                continue
-                            print(f"Archiving output file {output_path}")
-                            for output_path in self.get_related_files(output_path):
-                                if not os.path.exists(output_path):
-                                    continue
-                                try:
-                                    shutil.copy(output_path, abs_path)
-                                except shutil.SameFileError:
-                                    pass
-                                except Exception as err:
-                                    logger.error(
-                                        "Error copying output file %s to %s: %s",
-                                        output_path,
-                                        abs_path,
-                                        err,
-                                    )
-
-                    # Clean outputs if required
-                    if self.clean_outputs:
-                        for key in self.outputs.keys():
-                            output_path = args[key]
-                            if not os.path.exists(output_path):
-                                continue
-                            print(f"Removing output file {output_path}")
-                            for output_path in self.get_related_files(output_path):
-                                if not os.path.exists(output_path):
-                                    continue
-                                try:
-                                    os.remove(output_path)
-                                except Exception as err:
-                                    logger.error(
-                                        "Error removing output file %s: %s",
-                                        output_path,
-                                        err,
-                                    )
-
-                    # Calculate run summary
-                    run_summary = calculate_run_summary(out)
-                    # Append run summaries to the list for generating set runs summary and report
-                    run_summaries.append(run_summary)
-
-                # TODO: Generate summary of the set runs.
-                total_runs = len(run_summaries)
-
-                success_rate = (
-                    (sum(1 for run in run_summaries if run["success"]) / total_runs)
-                    if total_runs > 0
-                    else 0
+                set_summary = calculate_set_summary(
+                    set_id, self._get_run_arguments(data), run_summaries
                 )
-
-                # Calculate average and standard deviation of execution time for all runs in a set
-                run_time_list = [
-                    run["run_time"] for run in run_summaries if "run_time" in run
-                ]
-                avg_run_time = statistics.mean(run_time_list) if run_time_list else 0
-                stdev_run_time = (
-                    statistics.stdev(run_time_list) if len(run_time_list) > 1 else 0
-                )
-
-                set_summary = {
-                    "set": set_id,
-                    "arguments": args,
-                    "total": total_runs,
-                    "success": success_rate,
-                    "avg_run_time": avg_run_time,
-                    "stdev_run_time": stdev_run_time,
-                    "runs": run_summaries,
-                }
                 # Append set summary to the list for generating report
                 set_summaries.append(set_summary)
 
                 # TODO: Store summary of the set runs.
-                set_summary_path = os.path.join(
-                    self.outdir, f"set_{set_id:0{len_sets}d}", "summary.json"
-                )
+                set_summary_path = os.path.join(set_path, "summary.json")
                 self._store(set_summary_path, set_summary)
 
-            duration = time.time() - start_time
+            duration = (time.perf_counter_ns() - start_ns) / 1e9
 
-            print(f"{num_sets} run(s) completed in {duration} s.")
+            logger.info("%s run(s) completed in %s s.", num_sets, duration)
 
             # Idle wait after the runs, if required
             if self.system_wait:
-                print(f"Waiting {self.system_wait} s after the scenario runs.")
+                logger.info("Waiting %s s after the scenario runs.", self.system_wait)
                 time.sleep(self.system_wait)
 
             # Perform endline monitoring after the runs, if required
             if self.system_monitor:
-                print(f"Endline monitoring for {self.system_monitor} s.")
+                logger.info("Endline monitoring for %s s.", self.system_monitor)
                 result["endline"] = monitor_system(self.system_monitor)
-                self._store_result(result)
+
+            # Store scenario results
+            self._store_result(result)
 
             # TODO: Generate summary of all runs.
             # TODO: Store summary of all runs.
 
             # Generate report from set summaries
+            from .report import generate_html_report
+
             report_path = os.path.join(self.outdir, "report.html")
             generate_html_report(
                 system_data=result, set_summaries=set_summaries, output_path=report_path
             )
 
         except KeyboardInterrupt:
-            print("Benchmark run interrupted by user.")
+            logger.warning("Benchmark run interrupted by user.")
+            # Store partial scenario results
+            if result:
+                self._store_result(result)
 
         except Exception:
+            # Store partial scenario results
+            if result:
+                self._store_result(result)
             raise
 
         return result
 
 
+_SCENARIO_PARAMS = tuple(
+    key for key in inspect.signature(Scenario.__init__).parameters if key != "self"
+)
+
+
 def load_scenario(path: str, **kwargs) -> Scenario:
     """Load scenario from a YAML file and customize it keyword arguments, if required.
 
@@ -580,9 +711,14 @@ def load_scenario(path: str, **kwargs) -> Scenario:
         Configured scenario.
     """
     # Load scenario from file
+    import yaml
+
+    # REMARK: The LibYAML based loader is used, if available.
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
     logger.debug("Loading scenario from %s", path)
     with open(path, "r", encoding="utf-8") as file:
-        scenario = yaml.safe_load(file)
+        scenario = yaml.load(file, Loader=loader)
 
     # Update scenario arguments
     logger.debug("Updating scenario with %s", kwargs)
@@ -597,11 +733,9 @@ def load_scenario(path: str, **kwargs) -> Scenario:
         scenario["name"] = os.path.splitext(os.path.basename(path))[0]
 
     # Sanitize arguments
-    args = {}
-    for key in inspect.signature(Scenario.__init__).parameters.keys():
-        val = scenario.get(key)
-        if key != "self" and val is not None:
-            args[key] = val
+    args = {
+        key: scenario[key] for key in _SCENARIO_PARAMS if scenario.get(key) is not None
+    }
 
     # Create scenario
     return Scenario(**args)